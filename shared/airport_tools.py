@@ -27,14 +27,14 @@ Usage:
 """
 from __future__ import annotations
 
+from bisect import bisect_right
 from collections import OrderedDict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, Iterable, List, Optional, OrderedDict as OrderedDictType, TypedDict
 import os
-import urllib.parse
-import json
-import urllib.request
+import threading
 
+import httpx
 from euro_aip.models.airport import Airport
 from euro_aip.models.navpoint import NavPoint
 
@@ -85,11 +85,29 @@ EUROPEAN_COUNTRY_CODES = {
 }
 
 
+_http_client: Optional[httpx.Client] = None
+
+
+def _get_http_client() -> httpx.Client:
+    """Shared HTTP client so geocoding requests reuse pooled keep-alive connections."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(timeout=10)
+    return _http_client
+
+
+# Successful geocodes by query; place names resolve the same way across a session
+_GEOCODE_CACHE_SIZE = 256
+_geocode_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_geocode_cache_lock = threading.Lock()
+
+
 def _geoapify_geocode(query: str) -> Optional[Dict[str, Any]]:
     """
     Forward-geocode a free-text location using Geoapify.
 
     Prefers European locations for ambiguous queries (e.g., "Bromley" returns UK, not USA).
+    Successful results are cached in a bounded LRU; failures are retried on the next call.
 
     Args:
         query: Free-text location name (e.g., "Paris", "Lake Geneva")
@@ -98,6 +116,23 @@ def _geoapify_geocode(query: str) -> Optional[Dict[str, Any]]:
         Dict with 'lat', 'lon', 'formatted', 'country_code' on success;
         None on failure or if GEOAPIFY_API_KEY is not set.
     """
+    with _geocode_cache_lock:
+        cached = _geocode_cache.get(query)
+        if cached is not None:
+            _geocode_cache.move_to_end(query)
+            return dict(cached)
+
+    result = _geoapify_fetch(query)
+    if result is not None:
+        with _geocode_cache_lock:
+            _geocode_cache[query] = dict(result)
+            if len(_geocode_cache) > _GEOCODE_CACHE_SIZE:
+                _geocode_cache.popitem(last=False)
+    return result
+
+
+def _geoapify_fetch(query: str) -> Optional[Dict[str, Any]]:
+    """Uncached Geoapify request behind _geoapify_geocode."""
     api_key = os.environ.get("GEOAPIFY_API_KEY")
     if not api_key:
         return None
@@ -108,37 +143,36 @@ def _geoapify_geocode(query: str) -> Optional[Dict[str, Any]]:
         "format": "json",
         "apiKey": api_key,
     }
-    url = f"{base_url}?{urllib.parse.urlencode(params)}"
     try:
-        with urllib.request.urlopen(url, timeout=10) as resp:
-            payload = resp.read()
-            data = json.loads(payload.decode("utf-8"))
-            results = data.get("results") or []
-            if not results:
-                return None
-
-            # Prefer European results for ambiguous queries like "Bromley"
-            selected = None
-            for result in results:
-                country_code = (result.get("country_code") or "").upper()
-                if country_code in EUROPEAN_COUNTRY_CODES:
-                    selected = result
-                    break
-
-            # Fall back to first result if no European match
-            if not selected:
-                selected = results[0]
-
-            lat = selected.get("lat")
-            lon = selected.get("lon")
-            if lat is None or lon is None:
-                return None
-            return {
-                "lat": float(lat),
-                "lon": float(lon),
-                "formatted": selected.get("formatted") or query,
-                "country_code": selected.get("country_code"),
-            }
+        resp = _get_http_client().get(base_url, params=params)
+        resp.raise_for_status()
+        data = resp.json()
+        results = data.get("results") or []
+        if not results:
+            return None
+
+        # Prefer European results for ambiguous queries like "Bromley"
+        selected = None
+        for result in results:
+            country_code = (result.get("country_code") or "").upper()
+            if country_code in EUROPEAN_COUNTRY_CODES:
+                selected = result
+                break
+
+        # Fall back to first result if no European match
+        if not selected:
+            selected = results[0]
+
+        lat = selected.get("lat")
+        lon = selected.get("lon")
+        if lat is None or lon is None:
+            return None
+        return {
+            "lat": float(lat),
+            "lon": float(lon),
+            "formatted": selected.get("formatted") or query,
+            "country_code": selected.get("country_code"),
+        }
     except Exception:
         return None
 
@@ -189,13 +223,17 @@ def _find_nearest_airport_in_db(
     center_point = NavPoint(latitude=geocode["lat"], longitude=geocode["lon"], name=geocode["formatted"])
     geocode_country = geocode.get("country_code")  # ISO-2 country code from Geoapify
 
+    # Positions of airports in the geocoded country (codes are upper-cased once in the index)
+    index = _get_airport_index(ctx.model)
+    same_country = set(index.by_country.get(geocode_country.upper(), ())) if geocode_country else set()
+
     # Find airports within radius, tracking both same-country and any-country nearest
     nearest_same_country = None
     nearest_same_country_distance = float('inf')
     nearest_any = None
     nearest_any_distance = float('inf')
 
-    for apt in ctx.model.airports:
+    for i, apt in enumerate(index.airports):
         if not getattr(apt, "navpoint", None):
             continue
         try:
@@ -212,11 +250,9 @@ def _find_nearest_airport_in_db(
             nearest_any = apt
 
         # Track nearest airport in same country (if country known)
-        if geocode_country and getattr(apt, "iso_country", None):
-            if apt.iso_country.upper() == geocode_country.upper():
-                if distance_nm < nearest_same_country_distance:
-                    nearest_same_country_distance = distance_nm
-                    nearest_same_country = apt
+        if i in same_country and distance_nm < nearest_same_country_distance:
+            nearest_same_country_distance = distance_nm
+            nearest_same_country = apt
 
     # Prefer same-country airport if found, otherwise use nearest any
     if nearest_same_country:
@@ -262,6 +298,104 @@ def _airport_summary(a: Airport) -> Dict[str, Any]:
     }
 
 
+# Separator for the per-airport search key; it never occurs in airport fields and
+# queries containing it are skipped, so a substring match cannot span two fields
+_SEARCH_KEY_SEP = "\x00"
+
+
+@dataclass
+class AirportIndex:
+    """Lookup tables over the airport model, built once and reused by search tools.
+
+    Attributes:
+        model: The EuroAipModel the index was built from
+        airports: Airports in model order; the lists below hold positions in it
+        by_country: Positions grouped by upper-cased ISO country code
+        search_blob: Per-airport search keys (ident, upper-cased name, IATA code,
+                     municipality) joined into one string, so a query is scanned
+                     with str.find in C instead of a Python loop
+        key_starts: Offset in search_blob where each airport's key starts
+        summaries: _airport_summary() results by ICAO, filled on first use
+    """
+    model: Any
+    airports: List[Airport]
+    by_country: Dict[str, List[int]]
+    search_blob: str
+    key_starts: List[int]
+    summaries: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, model: Any) -> "AirportIndex":
+        airports = list(model.airports)
+        by_country: Dict[str, List[int]] = {}
+        keys: List[str] = []
+        key_starts: List[int] = []
+        offset = 0
+        for i, a in enumerate(airports):
+            by_country.setdefault((a.iso_country or "").upper(), []).append(i)
+            key = _SEARCH_KEY_SEP.join((
+                a.ident,
+                (a.name or "").upper(),
+                getattr(a, "iata_code", None) or "",
+                (a.municipality or "").upper(),
+            ))
+            keys.append(key)
+            key_starts.append(offset)
+            offset += len(key) + len(_SEARCH_KEY_SEP)
+        return cls(
+            model=model,
+            airports=airports,
+            by_country=by_country,
+            search_blob=_SEARCH_KEY_SEP.join(keys),
+            key_starts=key_starts,
+        )
+
+    def country(self, code: str, limit: int) -> List[Airport]:
+        """Return up to limit airports in the given upper-cased country, in model order."""
+        return [self.airports[i] for i in self.by_country.get(code, ())[:limit]]
+
+    def search(self, q: str, limit: int) -> List[Airport]:
+        """
+        Return up to limit airports, in model order, whose search key contains q
+        or whose country code equals q. q must already be upper-cased.
+        """
+        if not self.airports or _SEARCH_KEY_SEP in q:
+            return []
+        blob = self.search_blob
+        key_starts = self.key_starts
+        found: List[int] = []
+        pos = blob.find(q)
+        while pos != -1:
+            i = bisect_right(key_starts, pos) - 1
+            found.append(i)
+            if len(found) >= limit or i + 1 >= len(key_starts):
+                break
+            pos = blob.find(q, key_starts[i + 1])  # At most one hit per airport
+        by_country = self.by_country.get(q)
+        if by_country:
+            found = sorted(set(found).union(by_country))[:limit]
+        return [self.airports[i] for i in found]
+
+    def summary(self, a: Airport) -> Dict[str, Any]:
+        """Return a copy of the cached summary for a; callers may add keys to it."""
+        cached = self.summaries.get(a.ident)
+        if cached is None:
+            cached = self.summaries[a.ident] = _airport_summary(a)
+        return dict(cached)
+
+
+_airport_index: Optional[AirportIndex] = None
+
+
+def _get_airport_index(model: Any) -> AirportIndex:
+    """Return the index for model, rebuilding it only when the model changes."""
+    global _airport_index
+    index = _airport_index
+    if index is None or index.model is not model:
+        index = _airport_index = AirportIndex.build(model)
+    return index
+
+
 def _build_priority_context(
     base_context: Optional[Dict[str, Any]] = None,
     persona_id: Optional[str] = None
@@ -494,11 +628,10 @@ def search_airports(
     if len(parts) > 1 and all(len(p) == 4 and p.isalpha() for p in parts):
         # Multiple ICAO codes - search for each
         icao_set = set(parts)
-        for a in ctx.model.airports:
-            if a.ident in icao_set:
-                matches.append(a)
-                if len(matches) >= len(icao_set):
-                    break  # Found all requested airports
+        for icao in dict.fromkeys(parts):  # Query order, without duplicates
+            airport = ctx.model.airports.get(icao)
+            if airport:
+                matches.append(airport)
 
         # Skip country detection and standard search
         # Filter and sort using common pipeline
@@ -513,7 +646,8 @@ def search_airports(
             persona_id=persona_id,
         )
 
-        airport_summaries = [_airport_summary(a) for a in result.airports]
+        index = _get_airport_index(ctx.model)
+        airport_summaries = [index.summary(a) for a in result.airports]
         filter_profile = _build_filter_profile({"search_query": query}, filters)
 
         return {
@@ -545,27 +679,14 @@ def search_airports(
     country_code = country_name_map.get(q)
     detected_country = None  # Track if we detected a country for filter_profile
 
+    index = _get_airport_index(ctx.model)
     if country_code:
         # Search by country code
         detected_country = country_code
-        for a in ctx.model.airports:
-            if (a.iso_country or "").upper() == country_code:
-                matches.append(a)
-                if len(matches) >= 200:
-                    break
+        matches = index.country(country_code, 200)
     else:
         # Standard search: ICAO, name, IATA, municipality, or ISO country
-        for a in ctx.model.airports:
-            if (
-                (q in a.ident)
-                or (a.name and q in a.name.upper())
-                or (getattr(a, "iata_code", None) and q in a.iata_code)
-                or (a.municipality and q in a.municipality.upper())
-                or ((a.iso_country or "").upper() == q)  # Also check ISO country code
-            ):
-                matches.append(a)
-                if len(matches) >= 200:  # Get more candidates before filtering
-                    break
+        matches = index.search(q, 200)  # Get more candidates before filtering
 
     # Filter and sort using common pipeline
     persona_id = kwargs.pop("_persona_id", None)
@@ -580,7 +701,7 @@ def search_airports(
     )
 
     # Convert to summaries
-    airport_summaries = [_airport_summary(a) for a in result.airports]
+    airport_summaries = [index.summary(a) for a in result.airports]
 
     # Generate filter profile for UI synchronization
     # Include detected country so UI can sync the country filter dropdown
@@ -694,9 +815,10 @@ def find_airports_near_location(
     )
 
     # Build summaries with distance and notification info
+    index = _get_airport_index(ctx.model)
     airports: List[Dict[str, Any]] = []
     for a in result.airports:
-        summary = _airport_summary(a)
+        summary = index.summary(a)
         summary["distance_nm"] = round(point_distances.get(a.ident, 0.0), 2)
         if a.ident in result.notification_infos:
             summary["notification"] = result.notification_infos[a.ident].to_summary_dict()
@@ -852,9 +974,10 @@ def find_airports_near_route(
     )
 
     # Build summaries with distance and notification info
+    index = _get_airport_index(ctx.model)
     airports: List[Dict[str, Any]] = []
     for airport in result.airports:
-        summary = _airport_summary(airport)
+        summary = index.summary(airport)
         summary["segment_distance_nm"] = segment_distances.get(airport.ident, 0.0)
         if airport.ident in enroute_distances:
             summary["enroute_distance_nm"] = enroute_distances[airport.ident]
@@ -952,7 +1075,7 @@ def get_airport_details(
 
     return {
         "found": True,
-        "airport": _airport_summary(a),
+        "airport": _get_airport_index(ctx.model).summary(a),
         "runways": runways,
         "runway_summary": {
             "count": len(a.runways),
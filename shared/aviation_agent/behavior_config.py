@@ -150,6 +150,20 @@ class ComparisonConfig(BaseModel):
     )
 
 
+class ConversationConfig(BaseModel):
+    """
+    How much conversation history is sent to the planner and formatter LLMs.
+
+    The checkpointer keeps the full thread; only the LLM prompts are trimmed.
+    """
+    max_history_messages: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Send at most this many recent messages (starting on a user message). "
+                    "None = send the whole conversation."
+    )
+
+
 class PromptsConfig(BaseModel):
     planner: str  # Path to prompt file, e.g., "prompts/planner_v1.md"
     formatter: str
@@ -210,6 +224,7 @@ class AgentBehaviorConfig(BaseModel):
     reranking: RerankingConfig
     next_query_prediction: NextQueryPredictionConfig
     comparison: ComparisonConfig = ComparisonConfig()  # Cross-country comparison
+    conversation: ConversationConfig = ConversationConfig()  # LLM history window
     prompts: PromptsConfig
     examples: ExamplesConfig
     tools: Optional[ToolsConfig] = None  # Optional: tool description file paths
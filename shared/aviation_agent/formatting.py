@@ -11,6 +11,17 @@ from langchain_core.runnables import Runnable, RunnableLambda
 from .planning import AviationPlan
 
 
+# Tool result keys consumed only by the UI (map markers etc.), kept out of the
+# formatter prompt; "visualization" often repeats the full airport list
+UI_ONLY_RESULT_KEYS = frozenset({"visualization"})
+
+
+def tool_result_json(tool_result: Dict[str, Any]) -> str:
+    """Serialize a tool result for the formatter prompt, without UI-only keys."""
+    llm_view = {k: v for k, v in tool_result.items() if k not in UI_ONLY_RESULT_KEYS}
+    return json.dumps(llm_view, indent=2, ensure_ascii=False)
+
+
 def build_formatter_chain(llm: Runnable, system_prompt: Optional[str] = None) -> Runnable:
     """
     Return the LLM chain for formatting answers.
@@ -82,7 +93,7 @@ def build_formatter_runnable(llm: Runnable) -> Runnable:
         return {
             "messages": payload["messages"],
             "answer_style": plan.answer_style,
-            "tool_result_json": json.dumps(tool_result, indent=2, ensure_ascii=False),
+            "tool_result_json": tool_result_json(tool_result),
             "pretty_text": tool_result.get("pretty", ""),
         }
     
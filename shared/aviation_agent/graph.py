@@ -1,16 +1,16 @@
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+from langchain_core.messages import BaseMessage, trim_messages
 from langgraph.graph import END, StateGraph
 
 from .config import get_settings, get_behavior_config
 from shared.tool_context import get_tool_context_settings
 from .execution import ToolRunner
-from .formatting import build_formatter_chain
+from .formatting import build_formatter_chain, tool_result_json
 from .planning import AviationPlan
 from .state import AgentState
 from .next_query_predictor import NextQueryPredictor, extract_context_from_plan
@@ -63,11 +63,26 @@ def _build_agent_graph(
         )
         logger.info("✓ Next query predictor enabled")
 
+    max_history_messages = behavior_config.conversation.max_history_messages
+
+    def recent_messages(state: AgentState) -> List[BaseMessage]:
+        """Conversation window sent to the LLMs (bounded prompt size on long threads)."""
+        messages = state.get("messages") or []
+        if max_history_messages is None or len(messages) <= max_history_messages:
+            return messages
+        return trim_messages(
+            messages,
+            max_tokens=max_history_messages,
+            token_counter=len,  # Count messages, not tokens
+            strategy="last",
+            start_on="human",
+        )
+
     graph = StateGraph(AgentState)
 
     def planner_node(state: AgentState) -> Dict[str, Any]:
         try:
-            plan: AviationPlan = planner.invoke({"messages": state.get("messages") or []})
+            plan: AviationPlan = planner.invoke({"messages": recent_messages(state)})
             # Generate simple reasoning from plan
             reasoning_parts = [f"Selected tool: {plan.selected_tool}"]
             if plan.arguments.get("filters"):
@@ -273,9 +288,9 @@ def _build_agent_graph(
 
             chain_result = formatter_chain.invoke(
                 {
-                    "messages": state.get("messages") or [],
+                    "messages": recent_messages(state),
                     "answer_style": plan.answer_style if plan else "narrative_markdown",
-                    "tool_result_json": json.dumps(tool_result, indent=2, ensure_ascii=False),
+                    "tool_result_json": tool_result_json(tool_result),
                     "pretty_text": tool_result.get("pretty", ""),
                 }
             )
@@ -44,6 +44,10 @@ class AviationToolClient:
             )
             for name, spec in specs.items()
         }
+        # Handler signatures are fixed, so decide once whether each takes _persona_id
+        self._accepts_persona_id: Dict[str, bool] = {
+            name: _accepts_persona_id(tool.handler) for name, tool in self._tools.items()
+        }
 
     @property
     def tools(self) -> Mapping[str, AviationTool]:
@@ -62,24 +66,24 @@ class AviationToolClient:
         tool = self.get_tool(tool_name)
         try:
             # Filter out _persona_id if the tool handler doesn't accept it
-            # Check if function accepts **kwargs or has _persona_id parameter
-            sig = inspect.signature(tool.handler)
-            accepts_kwargs = any(
-                param.kind == inspect.Parameter.VAR_KEYWORD
-                for param in sig.parameters.values()
-            )
-            has_persona_param = "_persona_id" in sig.parameters
-            
-            # Filter arguments based on function signature
             filtered_args = dict(arguments)
-            if "_persona_id" in filtered_args and not (accepts_kwargs or has_persona_param):
-                filtered_args = {k: v for k, v in filtered_args.items() if k != "_persona_id"}
+            if "_persona_id" in filtered_args and not self._accepts_persona_id[tool_name]:
+                del filtered_args["_persona_id"]
             
             return tool.handler(self._context, **filtered_args)
         except Exception as exc:  # pragma: no cover - surface entire exception message
             raise AviationToolInvocationError(f"Tool '{tool_name}' failed: {exc}") from exc
 
 
+def _accepts_persona_id(handler: Callable[..., Any]) -> bool:
+    """Whether handler takes **kwargs or an explicit _persona_id parameter."""
+    sig = inspect.signature(handler)
+    return "_persona_id" in sig.parameters or any(
+        param.kind == inspect.Parameter.VAR_KEYWORD
+        for param in sig.parameters.values()
+    )
+
+
 def render_tool_catalog(tools: Iterable[AviationTool]) -> str:
     """
     Convert the manifest into a concise string suitable for planner prompts.
@@ -462,14 +462,17 @@ class GAFriendlinessBuilder:
             if airport_data and "aerops" in airport_data:
                 fee_bands = aggregate_fees_by_band(airport_data["aerops"])
         
-        # Compute rating stats
-        ratings = [r.rating for r in reviews if r.rating is not None]
-        rating_avg = sum(ratings) / len(ratings) if ratings else None
-        rating_count = len(ratings)
-        
-        # Get last review timestamp
-        timestamps = [r.timestamp for r in reviews if r.timestamp]
-        last_review = max(timestamps) if timestamps else None
+        # Compute rating stats and last review timestamp in one pass
+        rating_total = 0.0
+        rating_count = 0
+        last_review = None
+        for r in reviews:
+            if r.rating is not None:
+                rating_total += r.rating
+                rating_count += 1
+            if r.timestamp and (last_review is None or r.timestamp > last_review):
+                last_review = r.timestamp
+        rating_avg = rating_total / rating_count if rating_count else None
         
         # Build airport stats
         stats = AirportStats(
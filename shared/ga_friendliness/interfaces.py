@@ -162,6 +162,11 @@ class StorageInterface(ABC):
         """Read stats for a single airport."""
         pass
 
+    @abstractmethod
+    def get_airfield_stats_batch(self, icaos: List[str]) -> Dict[str, AirportStats]:
+        """Read stats for multiple airports, keyed by ICAO."""
+        pass
+
     @abstractmethod
     def get_all_icaos(self) -> List[str]:
         """Get list of all ICAOs in ga_airfield_stats."""
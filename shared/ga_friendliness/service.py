@@ -9,7 +9,7 @@ all query functionality.
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import logging
 import sqlite3
 import re
@@ -23,6 +23,13 @@ from .features import get_fee_band_for_mtow
 
 logger = logging.getLogger(__name__)
 
+# Cleanup patterns for empty fields in parsed notification summaries
+_TRAILING_EMPTY_HOURS = re.compile(r'\|\s*Hours:\s*$')
+_EMPTY_HOURS_LINE = re.compile(r'^Hours:\s*$')
+_EMPTY_PIPE_HOURS_LINE = re.compile(r'^\|\s*Hours:\s*$')
+_TRAILING_PIPE = re.compile(r'\s*\|\s*$')
+_EMPTY_CONTACT_LINE = re.compile(r'^[📞📧]\s*$')
+
 
 def _get_notification_summary(icao: str) -> Optional[str]:
     """
@@ -63,13 +70,13 @@ def _get_notification_summary(icao: str) -> Optional[str]:
                 continue
             
             # Remove patterns like "| Hours:" at end of line
-            line = re.sub(r'\|\s*Hours:\s*$', '', line)
+            line = _TRAILING_EMPTY_HOURS.sub('', line)
             # Remove "Hours:" alone at start
-            line = re.sub(r'^Hours:\s*$', '', line)
+            line = _EMPTY_HOURS_LINE.sub('', line)
             # Remove lines that are just "| Hours:"
-            line = re.sub(r'^\|\s*Hours:\s*$', '', line)
+            line = _EMPTY_PIPE_HOURS_LINE.sub('', line)
             # Remove trailing " |"
-            line = re.sub(r'\s*\|\s*$', '', line)
+            line = _TRAILING_PIPE.sub('', line)
             line = line.strip()
             
             # Skip if line became empty
@@ -79,7 +86,7 @@ def _get_notification_summary(icao: str) -> Optional[str]:
             if line in ("📞", "📧"):
                 continue
             # Skip lines like "📞 " or "📧 " with only whitespace after
-            if re.match(r'^[📞📧]\s*$', line):
+            if _EMPTY_CONTACT_LINE.match(line):
                 continue
                 
             cleaned_lines.append(line)
@@ -113,6 +120,8 @@ class GAFriendlinessService:
         self.storage: Optional[GAMetaStorage] = None
         self.persona_manager: Optional[PersonaManager] = None
         self._enabled = False
+        # (persona_id, ICAO) -> score (None = no data); only used in readonly mode
+        self._persona_score_cache: Dict[Tuple[str, str], Optional[float]] = {}
         
         if db_path and Path(db_path).exists():
             try:
@@ -274,6 +283,62 @@ class GAFriendlinessService:
         
         return results
     
+    def get_persona_scores_batch(
+        self,
+        icaos: List[str],
+        persona_id: str = "ifr_touring_sr22"
+    ) -> Dict[str, float]:
+        """
+        Get persona scores for multiple airports with a single stats query.
+        
+        Lighter than calling get_summary_dict per airport: skips review summaries
+        and notification lookups, which airport ranking does not need.
+        
+        Args:
+            icaos: List of ICAO codes
+            persona_id: Persona to compute scores for
+            
+        Returns:
+            Dict mapping ICAO (as given) -> score, only for airports with a score.
+        """
+        if not self._enabled or not self.storage or not self.persona_manager:
+            return {}
+        
+        cache = self._persona_score_cache
+        by_upper = {icao.upper(): icao for icao in icaos}
+        scores: Dict[str, float] = {}
+        
+        missing = []
+        for icao_upper, icao in by_upper.items():
+            key = (persona_id, icao_upper)
+            if key not in cache:
+                missing.append(icao_upper)
+            elif cache[key] is not None:
+                scores[icao] = cache[key]
+        
+        if not missing:
+            return scores
+        
+        try:
+            stats_by_icao = self.storage.get_airfield_stats_batch(missing)
+        except Exception as e:
+            logger.warning(f"Error getting GA persona scores: {e}")
+            return scores
+        
+        for icao_upper in missing:
+            stats = stats_by_icao.get(icao_upper)
+            score = self.persona_manager.compute_score(persona_id, stats) if stats else None
+            if score is not None:
+                scores[by_upper[icao_upper]] = score
+            # Database is static in readonly mode, so negative hits are cacheable too
+            if self.readonly:
+                cache[(persona_id, icao_upper)] = score
+        return scores
+    
+    def clear_cache(self) -> None:
+        """Clear cached persona scores (e.g., after the database was rebuilt)."""
+        self._persona_score_cache.clear()
+    
     def get_summary_dict(
         self,
         icao: str,
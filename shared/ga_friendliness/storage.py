@@ -56,6 +56,44 @@ def parse_timestamp(timestamp_str: str) -> datetime:
     raise ValueError(f"Unable to parse timestamp: {timestamp_str}")
 
 
+# Conservative bound on bound parameters per statement (older SQLite builds cap at 999)
+_MAX_SQL_VARIABLES = 900
+
+
+def _row_to_airport_stats(row: sqlite3.Row) -> AirportStats:
+    """Build AirportStats from a ga_airfield_stats row."""
+    return AirportStats(
+        icao=row["icao"],
+        rating_avg=row["rating_avg"],
+        rating_count=row["rating_count"] or 0,
+        last_review_utc=row["last_review_utc"],
+        fee_band_0_749kg=row["fee_band_0_749kg"],
+        fee_band_750_1199kg=row["fee_band_750_1199kg"],
+        fee_band_1200_1499kg=row["fee_band_1200_1499kg"],
+        fee_band_1500_1999kg=row["fee_band_1500_1999kg"],
+        fee_band_2000_3999kg=row["fee_band_2000_3999kg"],
+        fee_band_4000_plus_kg=row["fee_band_4000_plus_kg"],
+        fee_currency=row["fee_currency"],
+        fee_last_updated_utc=row["fee_last_updated_utc"],
+        aip_ifr_available=row["aip_ifr_available"] or 0,
+        aip_night_available=row["aip_night_available"] or 0,
+        aip_hotel_info=row["aip_hotel_info"],
+        aip_restaurant_info=row["aip_restaurant_info"],
+        review_cost_score=row["review_cost_score"],
+        review_hassle_score=row["review_hassle_score"],
+        review_review_score=row["review_review_score"],
+        review_ops_ifr_score=row["review_ops_ifr_score"],
+        review_ops_vfr_score=row["review_ops_vfr_score"],
+        review_access_score=row["review_access_score"],
+        review_fun_score=row["review_fun_score"],
+        review_hospitality_score=row["review_hospitality_score"],
+        aip_ops_ifr_score=row["aip_ops_ifr_score"],
+        aip_hospitality_score=row["aip_hospitality_score"],
+        source_version=row["source_version"] or "unknown",
+        scoring_version=row["scoring_version"] or "unknown",
+    )
+
+
 class GAMetaStorage(StorageInterface):
     """
     Handles all database operations for GA persona database.
@@ -188,36 +226,31 @@ class GAMetaStorage(StorageInterface):
             if row is None:
                 return None
 
-            return AirportStats(
-                icao=row["icao"],
-                rating_avg=row["rating_avg"],
-                rating_count=row["rating_count"] or 0,
-                last_review_utc=row["last_review_utc"],
-                fee_band_0_749kg=row["fee_band_0_749kg"],
-                fee_band_750_1199kg=row["fee_band_750_1199kg"],
-                fee_band_1200_1499kg=row["fee_band_1200_1499kg"],
-                fee_band_1500_1999kg=row["fee_band_1500_1999kg"],
-                fee_band_2000_3999kg=row["fee_band_2000_3999kg"],
-                fee_band_4000_plus_kg=row["fee_band_4000_plus_kg"],
-                fee_currency=row["fee_currency"],
-                fee_last_updated_utc=row["fee_last_updated_utc"],
-                aip_ifr_available=row["aip_ifr_available"] or 0,
-                aip_night_available=row["aip_night_available"] or 0,
-                aip_hotel_info=row["aip_hotel_info"],
-                aip_restaurant_info=row["aip_restaurant_info"],
-                review_cost_score=row["review_cost_score"],
-                review_hassle_score=row["review_hassle_score"],
-                review_review_score=row["review_review_score"],
-                review_ops_ifr_score=row["review_ops_ifr_score"],
-                review_ops_vfr_score=row["review_ops_vfr_score"],
-                review_access_score=row["review_access_score"],
-                review_fun_score=row["review_fun_score"],
-                review_hospitality_score=row["review_hospitality_score"],
-                aip_ops_ifr_score=row["aip_ops_ifr_score"],
-                aip_hospitality_score=row["aip_hospitality_score"],
-                source_version=row["source_version"] or "unknown",
-                scoring_version=row["scoring_version"] or "unknown",
-            )
+            return _row_to_airport_stats(row)
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to read airfield stats: {e}")
+
+    def get_airfield_stats_batch(self, icaos: List[str]) -> Dict[str, AirportStats]:
+        """
+        Read stats for multiple airports in as few queries as possible.
+
+        Returns:
+            Dict mapping ICAO -> AirportStats (only airports with stats).
+        """
+        unique_icaos = list(dict.fromkeys(icaos))
+        results: Dict[str, AirportStats] = {}
+        try:
+            conn = self._get_connection()
+            for start in range(0, len(unique_icaos), _MAX_SQL_VARIABLES):
+                chunk = unique_icaos[start:start + _MAX_SQL_VARIABLES]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = conn.execute(
+                    f"SELECT * FROM ga_airfield_stats WHERE icao IN ({placeholders})",
+                    chunk,
+                )
+                for row in cursor.fetchall():
+                    results[row["icao"]] = _row_to_airport_stats(row)
+            return results
         except sqlite3.Error as e:
             raise StorageError(f"Failed to read airfield stats: {e}")
 
@@ -2,10 +2,14 @@
 Models for notification requirement parsing.
 """
 
+import re
 from enum import Enum
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 
+# Hours in weekday rule strings such as "24h notice" or "48 h"
+HOURS_NOTICE_PATTERN = re.compile(r'(\d+)\s*h')
+
 
 class RuleType(str, Enum):
     """Type of notification rule."""
@@ -125,22 +129,28 @@ class ParsedNotificationRules(BaseModel):
         if self.is_on_request:
             return "On request / by arrangement"
         
-        # Collect unique descriptions
-        summaries = []
-        for rule in self.rules:
-            if rule.notification_type == NotificationType.HOURS and rule.hours_notice:
-                weekday_desc = rule.get_weekday_description()
-                if weekday_desc == "all days":
-                    summaries.append(f"PPR {rule.hours_notice}h")
-                else:
-                    summaries.append(f"{weekday_desc}: PPR {rule.hours_notice}h")
-            elif rule.notification_type == NotificationType.BUSINESS_DAY:
-                time_str = f" before {rule.specific_time}" if rule.specific_time else ""
-                summaries.append(f"Last business day{time_str}")
-            elif rule.notification_type == NotificationType.ON_REQUEST:
-                summaries.append("O/R")
+        if len(self.rules) == 1:
+            return _format_rule(self.rules[0]) or "See detailed rules"
         
-        return "; ".join(summaries) if summaries else "See detailed rules"
+        summary = "; ".join(filter(None, map(_format_rule, self.rules)))
+        return summary or "See detailed rules"
+
+
+def _format_rule(rule: NotificationRule) -> Optional[str]:
+    """Format a single rule for ParsedNotificationRules.get_summary (None if not summarizable)."""
+    notification_type = rule.notification_type
+    if notification_type == NotificationType.HOURS and rule.hours_notice:
+        weekday_desc = rule.get_weekday_description()
+        if weekday_desc == "all days":
+            return f"PPR {rule.hours_notice}h"
+        return f"{weekday_desc}: PPR {rule.hours_notice}h"
+    if notification_type == NotificationType.BUSINESS_DAY:
+        if rule.specific_time:
+            return f"Last business day before {rule.specific_time}"
+        return "Last business day"
+    if notification_type == NotificationType.ON_REQUEST:
+        return "O/R"
+    return None
 
 
 class NotificationInfo:
@@ -245,8 +255,7 @@ class NotificationInfo:
                             return rule_value
                         if isinstance(rule_value, str):
                             # Parse strings like "24h notice", "48h", etc.
-                            import re
-                            match = re.search(r'(\d+)\s*h', rule_value.lower())
+                            match = HOURS_NOTICE_PATTERN.search(rule_value.lower())
                             if match:
                                 return int(match.group(1))
 
@@ -265,13 +274,12 @@ class NotificationInfo:
 
         # Check weekday rules for higher values
         if self.weekday_rules:
-            import re
             for rule_value in self.weekday_rules.values():
                 if isinstance(rule_value, int):
                     if max_hours is None or rule_value > max_hours:
                         max_hours = rule_value
                 elif isinstance(rule_value, str):
-                    match = re.search(r'(\d+)\s*h', rule_value.lower())
+                    match = HOURS_NOTICE_PATTERN.search(rule_value.lower())
                     if match:
                         hours = int(match.group(1))
                         if max_hours is None or hours > max_hours:
@@ -424,36 +432,35 @@ class HassleScore(BaseModel):
                 summary="Unable to parse notification rules",
             )
         
-        if parsed.is_h24:
-            return cls(
-                icao=icao,
-                level=HassleLevel.NONE,
-                score=0.0,
-                summary="H24 - No prior notice required",
-            )
+        # Summarize the rules in a single pass
+        has_h24 = False
+        all_on_request = True
+        all_as_ad_hours = True
+        has_weekend = False
+        has_schengen = False
+        max_hours: Optional[int] = None
+        for r in parsed.rules:
+            notification_type = r.notification_type
+            if notification_type == NotificationType.H24:
+                has_h24 = True
+            if notification_type != NotificationType.ON_REQUEST:
+                all_on_request = False
+            if notification_type != NotificationType.AS_AD_HOURS:
+                all_as_ad_hours = False
+            if r.weekday_start == 5 or r.includes_holidays:
+                has_weekend = True
+            if r.schengen_only or r.non_schengen_only:
+                has_schengen = True
+            if r.hours_notice is not None and (max_hours is None or r.hours_notice > max_hours):
+                max_hours = r.hours_notice
         
-        if parsed.is_on_request:
-            return cls(
-                icao=icao,
-                level=HassleLevel.LOW,
-                score=0.2,
-                summary="On request / by arrangement",
-            )
-        
-        # Check for "as AD hours" - low hassle
-        if all(r.notification_type == NotificationType.AS_AD_HOURS for r in parsed.rules):
-            return cls(
-                icao=icao,
-                level=HassleLevel.LOW,
-                score=0.15,
-                summary="As aerodrome hours",
-            )
+        # Fast path for shapes with a fixed score (H24, O/R, as AD hours)
+        fixed = _FIXED_HASSLE_SHAPES.get((has_h24, all_on_request, all_as_ad_hours))
+        if fixed is not None:
+            level, score, summary = fixed
+            return cls(icao=icao, level=level, score=score, summary=summary)
         
         # Calculate based on hours notice
-        max_hours = parsed.max_hours_notice
-        has_weekend = any(r.weekday_start == 5 or r.includes_holidays for r in parsed.rules)
-        has_schengen = any(r.schengen_only or r.non_schengen_only for r in parsed.rules)
-        
         if max_hours is None:
             # Business day rules or other complex rules
             level = HassleLevel.HIGH
@@ -491,3 +498,11 @@ class HassleScore(BaseModel):
             has_schengen_rules=has_schengen,
         )
 
+
+# Fixed (level, score, summary) outcomes keyed by (has_h24, all_on_request, all_as_ad_hours).
+# The three flags are mutually exclusive for a non-empty rule list.
+_FIXED_HASSLE_SHAPES = {
+    (True, False, False): (HassleLevel.NONE, 0.0, "H24 - No prior notice required"),
+    (False, True, False): (HassleLevel.LOW, 0.2, "On request / by arrangement"),
+    (False, False, True): (HassleLevel.LOW, 0.15, "As aerodrome hours"),
+}
@@ -100,6 +100,25 @@ class NotificationParser:
         re.IGNORECASE
     )
     
+    # Day-name mentions (used for multi-day detection)
+    DAY_MENTION_PATTERN = re.compile(r'\b(MON|TUE|WED|THU|FRI|SAT|SUN)\b', re.IGNORECASE)
+    
+    # Holiday references
+    HOL_PATTERN = re.compile(r'\bHOL(?:IDAYS?)?\b', re.IGNORECASE)
+    HOL_SUFFIX_PATTERN = re.compile(r'\s*(?:and\s+)?hol(?:idays?)?', re.IGNORECASE)
+    
+    # Schengen context patterns
+    SCHENGEN_WORD_PATTERN = re.compile(r'\bschengen\b', re.IGNORECASE)
+    PROHIBITED_WORD_PATTERN = re.compile(r'\bprohibited\b', re.IGNORECASE)
+    NON_SCHENGEN_PATTERN = re.compile(
+        r'\b(?:extra[- ]?schengen|non[- ]?schengen|outside\s+schengen)\b',
+        re.IGNORECASE
+    )
+    SCHENGEN_ONLY_PATTERN = re.compile(
+        r'\b(?:within\s+schengen|schengen\s+(?:flights?\s+)?only)\b',
+        re.IGNORECASE
+    )
+    
     # === COMPLEXITY INDICATORS ===
     
     # Patterns that indicate complex rules needing LLM
@@ -255,9 +274,9 @@ class NotificationParser:
         
         # Pre-check: if text is long or has complexity markers, don't return early
         is_simple_text = len(text) < 100
-        has_multiple_days = len(re.findall(r'\b(MON|TUE|WED|THU|FRI|SAT|SUN)\b', text, re.IGNORECASE)) >= 3
-        has_schengen = bool(re.search(r'\bschengen\b', text, re.IGNORECASE))
-        has_prohibited = bool(re.search(r'\bprohibited\b', text, re.IGNORECASE))
+        has_multiple_days = len(self.DAY_MENTION_PATTERN.findall(text)) >= 3
+        has_schengen = bool(self.SCHENGEN_WORD_PATTERN.search(text))
+        has_prohibited = bool(self.PROHIBITED_WORD_PATTERN.search(text))
         
         text_is_complex = has_multiple_days or has_schengen or has_prohibited or len(text) > 200
         
@@ -341,10 +360,7 @@ class NotificationParser:
                 indicators.append(name)
         
         # Check for multiple distinct day ranges
-        day_mentions = re.findall(
-            r'\b(MON|TUE|WED|THU|FRI|SAT|SUN)\b',
-            text, re.IGNORECASE
-        )
+        day_mentions = self.DAY_MENTION_PATTERN.findall(text)
         if len(set(d.upper() for d in day_mentions)) >= 4:
             indicators.append('many_day_references')
         
@@ -357,20 +373,10 @@ class NotificationParser:
         Returns:
             (schengen_only, non_schengen_only) tuple
         """
-        # Check for non-Schengen indicators (extra-Schengen, non-Schengen, outside Schengen)
-        non_schengen_pattern = re.compile(
-            r'\b(?:extra[- ]?schengen|non[- ]?schengen|outside\s+schengen)\b',
-            re.IGNORECASE
-        )
-        
-        # Check for Schengen-only indicators (within Schengen, Schengen flights only)
-        schengen_pattern = re.compile(
-            r'\b(?:within\s+schengen|schengen\s+(?:flights?\s+)?only)\b',
-            re.IGNORECASE
-        )
-        
-        is_non_schengen = bool(non_schengen_pattern.search(text))
-        is_schengen = bool(schengen_pattern.search(text))
+        # Non-Schengen indicators (extra-Schengen, non-Schengen, outside Schengen)
+        is_non_schengen = bool(self.NON_SCHENGEN_PATTERN.search(text))
+        # Schengen-only indicators (within Schengen, Schengen flights only)
+        is_schengen = bool(self.SCHENGEN_ONLY_PATTERN.search(text))
         
         # If both are mentioned, it's likely a complex case with separate rules
         if is_non_schengen and is_schengen:
@@ -399,7 +405,7 @@ class NotificationParser:
         """Parse day string into start/end day numbers."""
         day_str = day_str.lower().strip()
         includes_holidays = 'hol' in day_str
-        day_str = re.sub(r'\s*(?:and\s+)?hol(?:idays?)?', '', day_str, flags=re.IGNORECASE).strip()
+        day_str = self.HOL_SUFFIX_PATTERN.sub('', day_str).strip()
         
         if day_str in self.DAY_MAP:
             result = self.DAY_MAP[day_str]
@@ -431,7 +437,7 @@ class NotificationParser:
                 end_day = end_day_from_start
             
             # Also check the full matched text for HOL references
-            if not includes_hol and re.search(r'\bHOL(?:IDAYS?)?\b', matched_text, re.IGNORECASE):
+            if not includes_hol and self.HOL_PATTERN.search(matched_text):
                 includes_hol = True
             
             hours = int(hours_str) if hours_str else None
@@ -456,13 +462,12 @@ class NotificationParser:
         seen_hours = set()
         
         for match in self.HOURS_PATTERN.finditer(text):
-            hours = None
-            for group_num in [1, 2, 3]:
-                if match.group(group_num):
-                    hours = int(match.group(group_num))
-                    break
-            
-            if hours is None or hours in seen_hours:
+            hours_str = next((g for g in match.groups() if g), None)
+            if hours_str is None:
+                continue
+
+            hours = int(hours_str)
+            if hours in seen_hours:
                 continue
             
             seen_hours.add(hours)
@@ -7,9 +7,12 @@ query functionality.
 """
 
 import os
+import copy
 import json
 import sqlite3
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .models import NotificationInfo
@@ -26,6 +29,9 @@ class NotificationService:
     This is the main entry point for all notification data. It owns the database
     connection and provides all query methods.
     """
+
+    # Max get_notification_for_airport results kept per service instance
+    LOOKUP_CACHE_SIZE = 1024
     
     def __init__(self, db_path: Optional[str] = None, airports_db_path: Optional[str] = None):
         """
@@ -41,7 +47,14 @@ class NotificationService:
         
         self.db_path = db_path
         self.airports_db_path = airports_db_path
+        self._lookup_cache: "OrderedDict[Tuple[str, Optional[str]], Dict[str, Any]]" = OrderedDict()
+        self._lookup_cache_lock = threading.Lock()
         self._check_db()
+
+    def clear_cache(self) -> None:
+        """Drop cached lookups, e.g. after the notification database was rebuilt."""
+        with self._lookup_cache_lock:
+            self._lookup_cache.clear()
     
     def _check_db(self):
         """Check if database exists."""
@@ -288,7 +301,31 @@ class NotificationService:
             
         Returns:
             Notification requirements including notice period, hours, and contact info.
+
+        Successful lookups are cached per (ICAO, day), since the database is
+        read-only at runtime; callers get their own copy of the result.
         """
+        key = (icao.upper(), day_of_week)
+        with self._lookup_cache_lock:
+            cached = self._lookup_cache.get(key)
+            if cached is not None:
+                self._lookup_cache.move_to_end(key)
+        if cached is None:
+            cached = self._lookup_notification_for_airport(icao, day_of_week)
+            if "error" in cached:
+                return cached  # Don't cache database failures
+            with self._lookup_cache_lock:
+                self._lookup_cache[key] = cached
+                if len(self._lookup_cache) > self.LOOKUP_CACHE_SIZE:
+                    self._lookup_cache.popitem(last=False)
+        return copy.deepcopy(cached)
+
+    def _lookup_notification_for_airport(
+        self,
+        icao: str,
+        day_of_week: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Uncached body of get_notification_for_airport."""
         if not self.db_available:
             return {
                 "found": False,
@@ -297,20 +334,42 @@ class NotificationService:
                 "pretty": f"Notification database not available. Cannot look up {icao.upper()}."
             }
         
+        airports_db = self._get_airports_db_path()
+
         try:
             conn = sqlite3.connect(self.db_path)
             conn.row_factory = sqlite3.Row
-            
-            cursor = conn.execute('''
-                SELECT 
-                    icao, rule_type, notification_type, hours_notice,
-                    operating_hours_start, operating_hours_end,
-                    weekday_rules, schengen_rules, contact_info,
-                    summary, confidence
-                FROM ga_notification_requirements
-                WHERE icao = ?
-            ''', (icao.upper(),))
-            
+
+            cursor = None
+            if airports_db and os.path.exists(airports_db):
+                # Fetch airport name/coordinates for visualization in the same query
+                try:
+                    conn.execute("ATTACH DATABASE ? AS airports_db", (airports_db,))
+                    cursor = conn.execute('''
+                        SELECT
+                            n.icao, n.rule_type, n.notification_type, n.hours_notice,
+                            n.operating_hours_start, n.operating_hours_end,
+                            n.weekday_rules, n.schengen_rules, n.contact_info,
+                            n.summary, n.confidence,
+                            a.name AS airport_name, a.latitude_deg, a.longitude_deg
+                        FROM ga_notification_requirements n
+                        LEFT JOIN airports_db.airports a ON a.icao_code = n.icao
+                        WHERE n.icao = ?
+                    ''', (icao.upper(),))
+                except sqlite3.Error:
+                    pass  # Airport details are optional; fall back to notification data only
+            if cursor is None:
+                cursor = conn.execute('''
+                    SELECT
+                        icao, rule_type, notification_type, hours_notice,
+                        operating_hours_start, operating_hours_end,
+                        weekday_rules, schengen_rules, contact_info,
+                        summary, confidence,
+                        NULL AS airport_name, NULL AS latitude_deg, NULL AS longitude_deg
+                    FROM ga_notification_requirements
+                    WHERE icao = ?
+                ''', (icao.upper(),))
+
             row = cursor.fetchone()
             conn.close()
             
@@ -332,29 +391,14 @@ class NotificationService:
                 "confidence": row["confidence"],
             }
             
-            # Lookup airport coordinates for visualization
-            airports_db = self._get_airports_db_path()
+            # Airport coordinates for visualization
+            airport_name = row["airport_name"]
             airport_coords = None
-            airport_name = None
-            if airports_db and os.path.exists(airports_db):
-                try:
-                    apt_conn = sqlite3.connect(airports_db)
-                    apt_conn.row_factory = sqlite3.Row
-                    apt_cursor = apt_conn.execute(
-                        "SELECT name, latitude_deg, longitude_deg FROM airports WHERE icao_code = ?", 
-                        (icao.upper(),)
-                    )
-                    apt_row = apt_cursor.fetchone()
-                    apt_conn.close()
-                    if apt_row:
-                        airport_name = apt_row["name"]
-                        if apt_row["latitude_deg"] and apt_row["longitude_deg"]:
-                            airport_coords = {
-                                "lat": apt_row["latitude_deg"],
-                                "lon": apt_row["longitude_deg"]
-                            }
-                except Exception:
-                    pass
+            if row["latitude_deg"] and row["longitude_deg"]:
+                airport_coords = {
+                    "lat": row["latitude_deg"],
+                    "lon": row["longitude_deg"]
+                }
             
             # Parse contact info
             if row["contact_info"]:
@@ -3,8 +3,9 @@
 Base class for prioritization strategies.
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
+from functools import cached_property
 from euro_aip.models.airport import Airport
 
 if TYPE_CHECKING:
@@ -13,13 +14,25 @@ if TYPE_CHECKING:
 
 @dataclass
 class ScoredAirport:
-    """An airport with priority score and sort keys."""
+    """
+    An airport with priority score and sort keys.
+
+    Metadata is stored as a shared key tuple plus a per-airport value tuple and
+    only expanded into a dict when accessed, since most scored airports are
+    dropped after sorting.
+    """
     airport: Airport
     priority_level: int  # 1 = highest priority, 3 = lowest
     score: float  # Within priority level, lower score = better (e.g., lower cost, shorter distance)
-    metadata: Dict[str, Any]  # Additional info (landing_fee, distance, etc.)
+    metadata_keys: Tuple[str, ...] = ()  # Names of additional info fields (shared per strategy)
+    metadata_values: Tuple[Any, ...] = ()  # Values matching metadata_keys
     distance_nm: float = 9999.0  # Distance for tiebreaking within same priority+score
 
+    @cached_property
+    def metadata(self) -> Dict[str, Any]:
+        """Additional info (ga_score, distance, etc.), built on first access."""
+        return dict(zip(self.metadata_keys, self.metadata_values))
+
 
 class PriorityStrategy(ABC):
     """
@@ -8,6 +8,8 @@ Uses distance bucketing with persona scores for ranking airports.
 
 Designed to be extensible for future combined scoring approaches.
 """
+from bisect import bisect_left
+from operator import attrgetter
 from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from euro_aip.models.airport import Airport
 from .base import PriorityStrategy, ScoredAirport
@@ -16,6 +18,21 @@ if TYPE_CHECKING:
     from shared.tool_context import ToolContext
 
 
+_BUCKET_SORT_KEY = attrgetter("priority_level", "score", "distance_nm")
+_BASIC_SORT_KEY = attrgetter("priority_level", "score")
+
+# ScoredAirport.metadata field names per search type
+_LOCATION_METADATA_KEYS = (
+    "ga_score", "effective_score", "persona_id", "has_ga_data", "distance_nm", "bucket",
+)
+_ROUTE_METADATA_KEYS = (
+    "ga_score", "effective_score", "persona_id", "has_ga_data",
+    "enroute_distance_nm", "segment_distance_nm", "position_deviation_nm",
+    "target_position_nm", "bucket", "sort_by",
+)
+_BASIC_METADATA_KEYS = ("ga_score", "effective_score", "persona_id", "has_ga_data")
+
+
 class PersonaOptimizedStrategy(PriorityStrategy):
     """
     Persona-optimized priority strategy with distance bucketing.
@@ -53,6 +70,14 @@ class PersonaOptimizedStrategy(PriorityStrategy):
     # Results in buckets: 0-10%, 10-20%, 20-35%, 35%+
     ROUTE_POSITION_BUCKETS = [0.10, 0.20, 0.35]
 
+    # Fallback scores when no GA data, indexed by (has_border << 1) | has_procedures
+    BASIC_SCORES = (
+        30.0,  # neither
+        60.0,  # procedures only
+        50.0,  # border crossing only
+        80.0,  # border + procedures: treat as decent GA score equivalent
+    )
+
     def score(
         self,
         airports: List[Airport],
@@ -71,56 +96,42 @@ class PersonaOptimizedStrategy(PriorityStrategy):
             # Fallback to basic persona scoring (no distance info)
             return self._score_basic(airports, context, tool_context)
 
-    def _get_ga_score(
+    def _get_ga_scores(
         self,
-        airport: Airport,
+        airports: List[Airport],
         persona_id: str,
         tool_context: Optional["ToolContext"]
-    ) -> Optional[float]:
-        """Get GA friendliness score for airport, or None if unavailable."""
-        if not tool_context or not tool_context.ga_friendliness_service:
-            return None
+    ) -> Dict[str, float]:
+        """Get GA friendliness scores for all airports in one batch (ident -> score)."""
+        service = tool_context.ga_friendliness_service if tool_context else None
+        if not service or not airports:
+            return {}
         try:
-            summary_dict = tool_context.ga_friendliness_service.get_summary_dict(
-                airport.ident,
+            return service.get_persona_scores_batch(
+                [airport.ident for airport in airports],
                 persona_id
             )
-            if summary_dict.get("has_data") and summary_dict.get("score") is not None:
-                return float(summary_dict["score"])
         except Exception:
-            pass
-        return None
+            return {}
 
     def _get_basic_score(self, airport: Airport) -> float:
         """Fallback score when no GA data: based on procedures and border crossing."""
-        has_procedures = bool(airport.procedures and len(airport.procedures) > 0)
-        has_border = bool(getattr(airport, 'point_of_entry', False))
-
-        if has_border and has_procedures:
-            return 80.0  # Treat as decent GA score equivalent
-        elif has_procedures:
-            return 60.0
-        elif has_border:
-            return 50.0
-        else:
-            return 30.0
+        # Airport always defines both attributes (point_of_entry may be None)
+        has_procedures = bool(airport.procedures)
+        has_border = bool(airport.point_of_entry)
+        return self.BASIC_SCORES[(has_border << 1) | has_procedures]
 
     def _get_distance_bucket(self, distance_nm: float) -> int:
         """Get bucket index for a distance. Lower bucket = closer = better."""
-        for i, threshold in enumerate(self.LOCATION_DISTANCE_BUCKETS):
-            if distance_nm <= threshold:
-                return i
-        return len(self.LOCATION_DISTANCE_BUCKETS)
+        # First threshold >= distance (thresholds are sorted ascending)
+        return bisect_left(self.LOCATION_DISTANCE_BUCKETS, distance_nm)
 
     def _get_position_bucket(self, position_deviation: float, total_distance: float) -> int:
         """Get bucket index for route position deviation. Lower = closer to target = better."""
         if total_distance <= 0:
             return 0
         deviation_pct = position_deviation / total_distance
-        for i, threshold in enumerate(self.ROUTE_POSITION_BUCKETS):
-            if deviation_pct <= threshold:
-                return i
-        return len(self.ROUTE_POSITION_BUCKETS)
+        return bisect_left(self.ROUTE_POSITION_BUCKETS, deviation_pct)
 
     def _score_location_search(
         self,
@@ -137,13 +148,14 @@ class PersonaOptimizedStrategy(PriorityStrategy):
         scored: List[ScoredAirport] = []
         point_distances = context.get("point_distances", {})
         persona_id = context.get("persona_id", "ifr_touring_sr22")
+        ga_scores = self._get_ga_scores(airports, persona_id, tool_context)
 
         for airport in airports:
             distance_nm = point_distances.get(airport.ident, 9999.0)
             bucket = self._get_distance_bucket(distance_nm)
 
             # Get persona score (or fallback)
-            ga_score = self._get_ga_score(airport, persona_id, tool_context)
+            ga_score = ga_scores.get(airport.ident)
             effective_score = ga_score if ga_score is not None else self._get_basic_score(airport)
 
             scored.append(ScoredAirport(
@@ -151,18 +163,15 @@ class PersonaOptimizedStrategy(PriorityStrategy):
                 priority_level=bucket,  # Lower bucket = closer = higher priority
                 score=-effective_score,  # Negative so higher persona = lower score = better
                 distance_nm=distance_nm,
-                metadata={
-                    "ga_score": ga_score,
-                    "effective_score": effective_score,
-                    "persona_id": persona_id,
-                    "has_ga_data": ga_score is not None,
-                    "distance_nm": distance_nm,
-                    "bucket": bucket,
-                }
+                metadata_keys=_LOCATION_METADATA_KEYS,
+                metadata_values=(
+                    ga_score, effective_score, persona_id, ga_score is not None,
+                    distance_nm, bucket,
+                ),
             ))
 
         # Sort by: bucket (distance) → persona score → exact distance (tiebreaker)
-        scored.sort(key=lambda x: (x.priority_level, x.score, x.distance_nm))
+        scored.sort(key=_BUCKET_SORT_KEY)
         return scored
 
     def _score_route_search(
@@ -183,6 +192,7 @@ class PersonaOptimizedStrategy(PriorityStrategy):
         total_distance = context.get("total_route_distance_nm", 0.0)
         sort_by = context.get("sort_by", "halfway")
         persona_id = context.get("persona_id", "ifr_touring_sr22")
+        ga_scores = self._get_ga_scores(airports, persona_id, tool_context)
 
         # Calculate target position based on sort_by
         if sort_by == "near_origin":
@@ -204,7 +214,7 @@ class PersonaOptimizedStrategy(PriorityStrategy):
             bucket = self._get_position_bucket(position_deviation, total_distance)
 
             # Get persona score (or fallback)
-            ga_score = self._get_ga_score(airport, persona_id, tool_context)
+            ga_score = ga_scores.get(airport.ident)
             effective_score = ga_score if ga_score is not None else self._get_basic_score(airport)
 
             scored.append(ScoredAirport(
@@ -212,22 +222,16 @@ class PersonaOptimizedStrategy(PriorityStrategy):
                 priority_level=bucket,  # Lower bucket = closer to target position
                 score=-effective_score,  # Negative so higher persona = lower score = better
                 distance_nm=segment_nm,  # Use segment distance for metadata/tiebreaker
-                metadata={
-                    "ga_score": ga_score,
-                    "effective_score": effective_score,
-                    "persona_id": persona_id,
-                    "has_ga_data": ga_score is not None,
-                    "enroute_distance_nm": enroute_nm,
-                    "segment_distance_nm": segment_nm,
-                    "position_deviation_nm": position_deviation,
-                    "target_position_nm": target_position,
-                    "bucket": bucket,
-                    "sort_by": sort_by,
-                }
+                metadata_keys=_ROUTE_METADATA_KEYS,
+                metadata_values=(
+                    ga_score, effective_score, persona_id, ga_score is not None,
+                    enroute_nm, segment_nm, position_deviation, target_position,
+                    bucket, sort_by,
+                ),
             ))
 
         # Sort by: position bucket → persona score → segment distance (tiebreaker)
-        scored.sort(key=lambda x: (x.priority_level, x.score, x.distance_nm))
+        scored.sort(key=_BUCKET_SORT_KEY)
         return scored
 
     def _score_basic(
@@ -239,9 +243,10 @@ class PersonaOptimizedStrategy(PriorityStrategy):
         """Fallback scoring when no distance info available. Sort by persona only."""
         scored: List[ScoredAirport] = []
         persona_id = context.get("persona_id", "ifr_touring_sr22")
+        ga_scores = self._get_ga_scores(airports, persona_id, tool_context)
 
         for airport in airports:
-            ga_score = self._get_ga_score(airport, persona_id, tool_context)
+            ga_score = ga_scores.get(airport.ident)
             effective_score = ga_score if ga_score is not None else self._get_basic_score(airport)
 
             scored.append(ScoredAirport(
@@ -249,15 +254,11 @@ class PersonaOptimizedStrategy(PriorityStrategy):
                 priority_level=1 if ga_score is not None else 2,
                 score=-effective_score,
                 distance_nm=9999.0,
-                metadata={
-                    "ga_score": ga_score,
-                    "effective_score": effective_score,
-                    "persona_id": persona_id,
-                    "has_ga_data": ga_score is not None,
-                }
+                metadata_keys=_BASIC_METADATA_KEYS,
+                metadata_values=(ga_score, effective_score, persona_id, ga_score is not None),
             ))
 
-        scored.sort(key=lambda x: (x.priority_level, x.score))
+        scored.sort(key=_BASIC_SORT_KEY)
         return scored
 
 
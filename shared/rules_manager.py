@@ -4,15 +4,29 @@ Rules Manager for Aviation Regulations
 Handles loading, indexing, filtering, and comparing country-specific aviation rules.
 """
 
+import itertools
 import json
 import logging
 import os
 import re
-from typing import Dict, Any, List, Optional, Set
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Set, Tuple
 from pathlib import Path
 
+# Optional fast JSON parser for rules.json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+# HTML tag stripper for plain-text answer display
+_HTML_TAG_RE = re.compile(r'<[^<]+?>')
+
 
 def normalize_tag(tag: str) -> str:
     """Normalize tag names: lowercase and replace spaces with underscores."""
@@ -59,9 +73,17 @@ def apply_tag_preferences(tags: List[str]) -> List[str]:
     return [t for t in normalized if t not in suppressed]
 
 
+def _rule_category(rule: Dict[str, Any]) -> str:
+    """Category used to group rules for display."""
+    return rule.get('category', 'General')
+
+
 class RulesManager:
     """Manages aviation rules data for multiple countries."""
 
+    # Max cached get_rules_for_country / compare_rules_between_countries results
+    QUERY_CACHE_SIZE = 512
+
     def __init__(self, rules_json_path: Optional[str] = None):
         """
         Initialize rules manager.
@@ -74,6 +96,24 @@ class RulesManager:
         self.rules_index = {}
         self.question_map: Dict[str, Dict[str, Any]] = {}
         self.loaded = False
+        # LRU of query results, valid for the current index (cleared by _build_index)
+        self._query_cache: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+
+    def _cached_query(self, key: Tuple[Any, ...]) -> Any:
+        """Return a cached query result (marking it recently used), or None."""
+        with self._query_cache_lock:
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                self._query_cache.move_to_end(key)
+            return cached
+
+    def _store_query(self, key: Tuple[Any, ...], result: Any) -> None:
+        """Cache a query result, evicting the least recently used beyond QUERY_CACHE_SIZE."""
+        with self._query_cache_lock:
+            self._query_cache[key] = result
+            if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
 
     def load_rules(self) -> bool:
         """
@@ -89,8 +129,11 @@ class RulesManager:
                 logger.warning(f"Rules file not found: {self.rules_json_path}")
                 return False
 
-            with open(rules_path, 'r', encoding='utf-8') as f:
-                rules_data = json.load(f)
+            if HAS_ORJSON:
+                rules_data = orjson.loads(rules_path.read_bytes())
+            else:
+                with open(rules_path, 'r', encoding='utf-8') as f:
+                    rules_data = json.load(f)
 
             # Handle both list format and dict format with "questions" key
             if isinstance(rules_data, list):
@@ -135,6 +178,13 @@ class RulesManager:
             'tags': {}
         }
         self.question_map = {}
+        with self._query_cache_lock:
+            self._query_cache.clear()
+        # Bind the index dicts once instead of looking them up per question/answer
+        by_country = self.rules_index['by_country']
+        by_id = self.rules_index['by_id']
+        categories = self.rules_index['categories']
+        tags_index = self.rules_index['tags']
 
         for question in self.rules:
             question_id = question.get('question_id') or question.get('id')
@@ -144,11 +194,13 @@ class RulesManager:
             question_text = question.get('question_text') or question.get('question') or ""
             question_raw = question.get('question_raw', "")
             question_prefix = question.get('question_prefix', "")
-            category = question.get('category') or "General"
+            # Category, tag and country strings repeat across thousands of entries:
+            # intern them so every entry shares one object per value
+            category = sys.intern(question.get('category') or "General")
             # Normalize tags: lowercase and replace spaces with underscores
             # Tags are dynamically injected into the planner prompt via get_available_tags()
             raw_tags = question.get('tags') or []
-            tags = [normalize_tag(t) for t in raw_tags]
+            tags = [sys.intern(normalize_tag(t)) for t in raw_tags]
             answers_by_country = question.get('answers_by_country') or {}
 
             question_info = {
@@ -162,15 +214,15 @@ class RulesManager:
             }
 
             self.question_map[question_id] = question_info
-            self.rules_index['by_id'][question_id] = question_info
-            self.rules_index['categories'].setdefault(category, set()).add(question_id)
+            by_id[question_id] = question_info
+            categories.setdefault(category, set()).add(question_id)
             for tag in tags:
-                self.rules_index['tags'].setdefault(tag, set()).add(question_id)
+                tags_index.setdefault(tag, set()).add(question_id)
 
             for country_code, answer in answers_by_country.items():
                 if not country_code:
                     continue
-                country_code = country_code.upper()
+                country_code = sys.intern(country_code.upper())
                 entry = {
                     'question_id': question_id,
                     'question_text': question_text,
@@ -184,12 +236,37 @@ class RulesManager:
                     'last_reviewed': answer.get('last_reviewed'),
                     'confidence': answer.get('confidence'),
                 }
-                self.rules_index['by_country'].setdefault(country_code, []).append(entry)
+                by_country.setdefault(country_code, []).append(entry)
 
         # Sort entries for deterministic output
-        for entries in self.rules_index['by_country'].values():
+        for entries in by_country.values():
             entries.sort(key=lambda x: x['question_text'].lower())
 
+        # Lower-cased (question, answer) text for search_term, keyed by id() of the
+        # index entry (owned by rules_index) so it never leaks into tool results
+        self.rules_index['search_text'] = {
+            id(entry): (
+                (entry['question_text'] or '').lower(),
+                (entry['answer_html'] or '').lower(),
+            )
+            for entries in by_country.values()
+            for entry in entries
+        }
+
+        # Answers stripped of HTML once for format_rules_for_display, keyed the same way
+        self.rules_index['answer_text'] = {
+            id(entry): _HTML_TAG_RE.sub('', entry['answer_html'] or '')
+            for entries in by_country.values()
+            for entry in entries
+        }
+
+        # Per-country entries grouped by lower-cased category, keeping the sorted order
+        by_country_category = self.rules_index['by_country_category'] = {}
+        for country_code, entries in by_country.items():
+            grouped = by_country_category[country_code] = {}
+            for entry in entries:
+                grouped.setdefault(entry['category'].lower(), []).append(entry)
+
         country_counts = {c: len(entries) for c, entries in self.rules_index['by_country'].items()}
         logger.info(
             "Built rules index: %d questions, %d countries, %d categories",
@@ -224,44 +301,70 @@ class RulesManager:
             return []
 
         country_code = country_code.upper()
-        entries = list(self.rules_index.get('by_country', {}).get(country_code, []))
+        cache_key = (
+            'country',
+            country_code,
+            category.lower() if category else None,
+            tuple(tags) if tags else None,
+            search_term.lower() if search_term else None,
+        )
+        cached = self._cached_query(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        country_entries = self.rules_index.get('by_country', {}).get(country_code, [])
         logger.debug(
             "Looking up %s in index, found %d rules. Available countries: %s",
             country_code,
-            len(entries),
+            len(country_entries),
             list(self.rules_index.get('by_country', {}).keys())
         )
 
-        # Apply category filter
+        # Apply category filter (substring match on the category name)
         if category:
-            entries = [r for r in entries if category.lower() in r.get('category').lower()]
+            category_lower = category.lower()
+            grouped = self.rules_index.get('by_country_category', {}).get(country_code, {})
+            matching = [name for name in grouped if category_lower in name]
+            if len(matching) == 1:
+                # Common case: one category matches, reuse its pre-grouped entries
+                entries = list(grouped[matching[0]])
+            else:
+                entries = [r for r in country_entries if category_lower in r['category'].lower()]
+        else:
+            entries = list(country_entries)
 
         # Apply tags filter (with suppression rules for domain-specific optimization)
         if tags:
             # Apply tag suppression: if specific tags are present, remove broader ones
             # e.g., 'vfr_ifr_transition' suppresses 'vfr' and 'ifr'
             filtered_tags = apply_tag_preferences(tags)
-            entries = [
-                r for r in entries
-                if any(tag in (r.get('tags') or []) for tag in filtered_tags)
-            ]
+            # Union of the tag index gives the matching question ids; one set lookup per rule
+            tags_index = self.rules_index.get('tags', {})
+            tagged_ids: Set[str] = set()
+            for tag in filtered_tags:
+                tagged_ids.update(tags_index.get(tag, ()))
+            entries = [r for r in entries if r['question_id'] in tagged_ids]
 
         # Apply search term filter
         if search_term:
             search_lower = search_term.lower()
-            entries = [
-                r for r in entries
-                if search_lower in (r.get('question_text') or '').lower()
-                or search_lower in (r.get('answer_html') or '').lower()
-            ]
-
+            search_text = self.rules_index.get('search_text', {})
+            matched = []
+            for r in entries:
+                question_lower, answer_lower = search_text[id(r)]
+                if search_lower in question_lower or search_lower in answer_lower:
+                    matched.append(r)
+            entries = matched
+
+        self._store_query(cache_key, tuple(entries))
         return entries
 
     def compare_rules_between_countries(
         self,
         country1: str,
         country2: str,
-        category: Optional[str] = None
+        category: Optional[str] = None,
+        max_differences: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Compare rules between two countries.
@@ -270,6 +373,8 @@ class RulesManager:
             country1: First country ISO-2 code
             country2: Second country ISO-2 code
             category: Optional category filter
+            max_differences: Optional cap on the difference entries returned
+                (all differing rules are still counted); None returns all
 
         Returns:
             Dict with comparison results
@@ -280,6 +385,17 @@ class RulesManager:
         if not self.loaded:
             return {}
 
+        cache_key = (
+            'compare',
+            country1.upper(),
+            country2.upper(),
+            category.lower() if category else None,
+            max_differences,
+        )
+        cached = self._cached_query(cache_key)
+        if cached is not None:
+            return dict(cached)
+
         logger.info(
             "Comparing rules for %s vs %s (category=%s) - total questions=%d",
             country1, country2, category, len(self.question_map)
@@ -288,47 +404,51 @@ class RulesManager:
         country1 = country1.upper()
         country2 = country2.upper()
 
-        rules1 = {
-            r['question_id']: r
-            for r in self.get_rules_for_country(country1, category=category)
-            if r.get('question_id')
-        }
-        rules2 = {
-            r['question_id']: r
-            for r in self.get_rules_for_country(country2, category=category)
-            if r.get('question_id')
-        }
+        # Index entries always carry a question_id (_build_index skips questions without one)
+        rules1 = {r['question_id']: r for r in self.get_rules_for_country(country1, category=category)}
+        rules2 = {r['question_id']: r for r in self.get_rules_for_country(country2, category=category)}
 
         logger.info("Found %d entries for %s and %d entries for %s", len(rules1), country1, len(rules2), country2)
 
         # Find differences
-        common_ids = set(rules1.keys()) & set(rules2.keys())
-        only_in_1 = set(rules1.keys()) - set(rules2.keys())
-        only_in_2 = set(rules2.keys()) - set(rules1.keys())
+        # dict key views support set algebra directly, no intermediate set() copies
+        keys1, keys2 = rules1.keys(), rules2.keys()
+        common_ids = keys1 & keys2
+        only_in_1 = keys1 - keys2
+        only_in_2 = keys2 - keys1
 
         differences = []
-        for qid in common_ids:
+        differences_count = 0
+        # Walk rules1 in its (question text) order so a capped list is deterministic
+        for qid in rules1:
+            if qid not in keys2:
+                continue
             r1 = rules1[qid]
             r2 = rules2[qid]
+            answer1 = r1['answer_html'] or ''
+            answer2 = r2['answer_html'] or ''
 
             # Compare answers (simplified - just check if different)
-            if (r1.get('answer_html') or '').strip() != (r2.get('answer_html') or '').strip():
+            if answer1 != answer2 and answer1.strip() != answer2.strip():
+                differences_count += 1
+                if max_differences is not None and len(differences) >= max_differences:
+                    continue
                 question = self.question_map.get(qid, {})
                 differences.append({
                     'question_id': qid,
-                    'question': question.get('question_text', r1.get('question_text')),
-                    'category': question.get('category', r1.get('category')),
+                    'question': question.get('question_text', r1['question_text']),
+                    'category': question.get('category', r1['category']),
                     country1: {
-                        'answer': r1.get('answer_html', ''),
-                        'links': r1.get('links', [])
+                        'answer': r1['answer_html'],
+                        'links': r1['links']
                     },
                     country2: {
-                        'answer': r2.get('answer_html', ''),
-                        'links': r2.get('links', [])
+                        'answer': r2['answer_html'],
+                        'links': r2['links']
                     }
                 })
 
-        return {
+        result = {
             'country1': country1.upper(),
             'country2': country2.upper(),
             'total_rules_country1': len(rules1),
@@ -337,11 +457,15 @@ class RulesManager:
             'only_in_country1': len(only_in_1),
             'only_in_country2': len(only_in_2),
             'differences': differences,
-            "differences_count": len(differences),
+            "differences_count": differences_count,
+            'truncated': differences_count > len(differences),
             'summary': self._format_comparison_summary(
-                country1, country2, differences, only_in_1, only_in_2, rules1, rules2
+                country1, country2, differences, only_in_1, only_in_2, rules1, rules2,
+                differences_count=differences_count
             )
         }
+        self._store_query(cache_key, result)
+        return dict(result)
 
     def compare_rules_across_countries(
         self,
@@ -375,24 +499,24 @@ class RulesManager:
                 category=category,
                 tags=tags
             )
+            # Index entries have every field set by _build_index: subscript, don't .get()
             for rule in rules:
-                question_id = rule.get('question_id') or rule.get('id')
-                if not question_id:
-                    continue
-
-                info = questions.setdefault(question_id, {
-                    "question_id": question_id,
-                    "question_text": rule.get('question_text') or rule.get('question') or '',
-                    "category": rule.get('category') or 'General',
-                    "tags": rule.get('tags') or [],
-                    "answers_by_country": {}
-                })
+                question_id = rule['question_id']
+                info = questions.get(question_id)
+                if info is None:
+                    info = questions[question_id] = {
+                        "question_id": question_id,
+                        "question_text": rule['question_text'],
+                        "category": rule['category'],
+                        "tags": rule['tags'],
+                        "answers_by_country": {}
+                    }
 
-                info['answers_by_country'][country.upper()] = {
-                    "answer_html": rule.get('answer_html') or '',
-                    "links": rule.get('links') or [],
-                    "last_reviewed": rule.get('last_reviewed'),
-                    "confidence": rule.get('confidence'),
+                info['answers_by_country'][country] = {
+                    "answer_html": rule['answer_html'] or '',
+                    "links": rule['links'],
+                    "last_reviewed": rule['last_reviewed'],
+                    "confidence": rule['confidence'],
                 }
 
         categories: Dict[str, List[Dict[str, Any]]] = {}
@@ -422,26 +546,33 @@ class RulesManager:
         only_in_1: Set[str],
         only_in_2: Set[str],
         rules1_map: Dict,
-        rules2_map: Dict
+        rules2_map: Dict,
+        differences_count: Optional[int] = None
     ) -> str:
         """Format a human-readable comparison summary."""
+        if differences_count is None:
+            differences_count = len(differences)
+        code1 = country1.upper()
+        code2 = country2.upper()
         lines = []
-        lines.append(f"\n**Rules Comparison: {country1.upper()} vs {country2.upper()}**\n")
+        lines.append(f"\n**Rules Comparison: {code1} vs {code2}**\n")
 
         if differences:
-            lines.append(f"**Different Answers ({len(differences)}):**\n")
+            lines.append(f"**Different Answers ({differences_count}):**\n")
             for diff in differences[:5]:  # Show first 5
-                lines.append(f"• **{diff['question']}**")
-                lines.append(f"  - {country1.upper()}: {diff[country1]['answer'][:100]}...")
-                lines.append(f"  - {country2.upper()}: {diff[country2]['answer'][:100]}...")
-                lines.append("")
+                # One entry per difference; the trailing newline keeps the blank separator line
+                lines.append(
+                    f"• **{diff['question']}**\n"
+                    f"  - {code1}: {diff[country1]['answer'][:100]}...\n"
+                    f"  - {code2}: {diff[country2]['answer'][:100]}...\n"
+                )
 
-            if len(differences) > 5:
-                lines.append(f"  ... and {len(differences) - 5} more differences\n")
+            if differences_count > 5:
+                lines.append(f"  ... and {differences_count - 5} more differences\n")
 
         if only_in_1:
-            lines.append(f"\n**Only in {country1.upper()} ({len(only_in_1)}):**")
-            for qid in list(only_in_1)[:3]:
+            lines.append(f"\n**Only in {code1} ({len(only_in_1)}):**")
+            for qid in itertools.islice(only_in_1, 3):
                 rule = rules1_map.get(qid) or {}
                 question = self.question_map.get(qid, {})
                 lines.append(f"• {question.get('question_text', rule.get('question_text', 'Unknown'))}")
@@ -449,8 +580,8 @@ class RulesManager:
                 lines.append(f"  ... and {len(only_in_1) - 3} more")
 
         if only_in_2:
-            lines.append(f"\n**Only in {country2.upper()} ({len(only_in_2)}):**")
-            for qid in list(only_in_2)[:3]:
+            lines.append(f"\n**Only in {code2} ({len(only_in_2)}):**")
+            for qid in itertools.islice(only_in_2, 3):
                 rule = rules2_map.get(qid) or {}
                 question = self.question_map.get(qid, {})
                 lines.append(f"• {question.get('question_text', rule.get('question_text', 'Unknown'))}")
@@ -459,6 +590,14 @@ class RulesManager:
 
         return "\n".join(lines)
 
+    def _answer_text(self, rule: Dict[str, Any]) -> str:
+        """Plain-text answer for display, using the stripped copy cached at index time."""
+        answer_text = self.rules_index.get('answer_text', {}).get(id(rule))
+        if answer_text is None:
+            # Rule dict not owned by the index (e.g. built by a caller): strip now
+            answer_text = _HTML_TAG_RE.sub('', rule.get('answer_html', 'No answer available'))
+        return answer_text
+
     def format_rules_for_display(
         self,
         rules: List[Dict[str, Any]],
@@ -478,22 +617,15 @@ class RulesManager:
             return "No rules found matching your criteria."
 
         if group_by_category:
-            # Group by category
-            by_category = {}
-            for rule in rules:
-                cat = rule.get('category', 'General')
-                if cat not in by_category:
-                    by_category[cat] = []
-                by_category[cat].append(rule)
-
+            # Group by category: a stable sort keeps each category's rules in input order
             lines = []
-            for category, cat_rules in sorted(by_category.items()):
+            rules_by_category = sorted(rules, key=_rule_category)
+            for category, group in itertools.groupby(rules_by_category, key=_rule_category):
+                cat_rules = list(group)
                 lines.append(f"\n**{category}** ({len(cat_rules)} rules):")
                 for rule in cat_rules:
                     lines.append(f"\n• **{rule.get('question_text', 'Unknown')}**")
-                    answer = rule.get('answer_html', 'No answer available')
-                    # Strip HTML tags for display
-                    answer_text = re.sub('<[^<]+?>', '', answer)
+                    answer_text = self._answer_text(rule)
                     lines.append(f"  {answer_text[:200]}...")
 
                     if rule.get('links'):
@@ -505,8 +637,7 @@ class RulesManager:
             lines = []
             for rule in rules[:20]:  # Limit total
                 lines.append(f"\n• **{rule.get('question_text', 'Unknown')}**")
-                answer = rule.get('answer_html', 'No answer available')
-                answer_text = re.sub('<[^<]+?>', '', answer)
+                answer_text = self._answer_text(rule)
                 lines.append(f"  {answer_text[:200]}...")
 
             if len(rules) > 20:
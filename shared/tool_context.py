@@ -8,6 +8,9 @@ GA friendliness service.
 """
 from __future__ import annotations
 
+import logging
+import os
+import pickle
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
@@ -20,6 +23,8 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .rules_manager import RulesManager
 
+logger = logging.getLogger(__name__)
+
 
 class ToolContextSettings(BaseSettings):
     """
@@ -41,6 +46,11 @@ class ToolContextSettings(BaseSettings):
         description="Path to airports.db SQLite database",
         alias="AIRPORTS_DB",
     )
+    airports_model_cache: Optional[Path] = Field(
+        default=None,
+        description="Optional pickle snapshot of the loaded airport model, reused while newer than airports_db",
+        alias="AIRPORTS_MODEL_CACHE",
+    )
     rules_json: Path = Field(
         default=Path("rules.json"),
         description="Path to rules.json for query answering",
@@ -74,6 +84,40 @@ def get_tool_context_settings() -> ToolContextSettings:
     return ToolContextSettings()
 
 
+def _load_airport_model(db_path: Path, cache_path: Optional[Path] = None) -> EuroAipModel:
+    """
+    Load the airport model from airports.db.
+
+    When cache_path is set, the loaded model is pickled there and later loads
+    unpickle it instead of rebuilding from SQLite, as long as the snapshot is
+    newer than the database. Any snapshot problem falls back to the database.
+    """
+    if cache_path and cache_path.exists():
+        try:
+            if cache_path.stat().st_mtime >= db_path.stat().st_mtime:
+                with cache_path.open("rb") as f:
+                    model = pickle.load(f)
+                logger.info(f"Loaded airport model snapshot from {cache_path}")
+                return model
+        except Exception as e:
+            logger.warning(f"Ignoring airport model snapshot {cache_path}: {e}")
+
+    model = DatabaseStorage(str(db_path)).load_model()
+
+    if cache_path:
+        # Write to a temporary file first so readers never see a partial snapshot
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            with tmp_path.open("wb") as f:
+                pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"Could not write airport model snapshot {cache_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    return model
+
+
 @dataclass
 class ToolContext:
     """
@@ -116,17 +160,13 @@ class ToolContext:
         Returns:
             ToolContext instance with requested services loaded
         """
-        import logging
-        logger = logging.getLogger(__name__)
-
         # Use provided settings or get cached default
         settings = settings or get_tool_context_settings()
 
         # Load core model (required if load_airports is True)
         model = None
         if load_airports:
-            storage = DatabaseStorage(str(settings.airports_db))
-            model = storage.load_model()
+            model = _load_airport_model(settings.airports_db, settings.airports_model_cache)
         else:
             raise ValueError("load_airports must be True - airports database is required")
 
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping
 
 import pytest
 from langchain_core.messages import HumanMessage
@@ -11,11 +13,17 @@ from langchain_core.runnables import RunnableLambda
 from shared.aviation_agent.config import AviationAgentSettings
 from shared.aviation_agent.tools import AviationToolClient
 
+try:
+    from orjson import loads as _json_loads  # Faster SSE payload decoding when installed
+except ImportError:
+    from json import loads as _json_loads
+
 
 def _project_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
+@lru_cache(maxsize=None)
 def _locate(filename: str) -> Path:
     candidates = [
         _project_root() / "data" / filename,
@@ -28,16 +36,50 @@ def _locate(filename: str) -> Path:
     raise FileNotFoundError(f"Unable to locate {filename}")
 
 
+def _iter_sse_events(response) -> Iterator[Dict[str, Any]]:
+    """Yield {"event": ..., "data": ...} dicts from an SSE response as frames arrive.
+
+    Follows SSE framing: a frame ends at a blank line, multi-line ``data:``
+    fields are joined with newlines and the event name defaults to "message".
+    Data is JSON-decoded; frames with undecodable data, and an unterminated
+    frame at end of stream, are skipped. Callers can
+    stop iterating early (e.g. inside a ``client.stream(...)`` block) without
+    reading the rest of the stream.
+    """
+    event_type = None
+    data_lines: list[str] = []
+    for line in response.iter_lines():
+        if not line:
+            # Blank line: dispatch the pending frame
+            if data_lines:
+                try:
+                    data = _json_loads("\n".join(data_lines))
+                except ValueError:  # json/orjson JSONDecodeError
+                    pass
+                else:
+                    yield {"event": event_type or "message", "data": data}
+            event_type = None
+            data_lines = []
+            continue
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "event":
+            event_type = value
+        elif field == "data":
+            data_lines.append(value)
+
+
 @pytest.fixture(scope="session")
-def data_files() -> Dict[str, str]:
-    return {
+def data_files() -> Mapping[str, str]:
+    return MappingProxyType({
         "airports_db": str(_locate("airports.db")),
         "rules_json": str(_locate("rules.json")),
-    }
+    })
 
 
 @pytest.fixture(scope="session")
-def agent_settings(data_files: Dict[str, str]) -> AviationAgentSettings:
+def agent_settings(data_files: Mapping[str, str]) -> AviationAgentSettings:
     # Set environment variables for ToolContextSettings
     os.environ["AIRPORTS_DB"] = data_files["airports_db"]
     os.environ["RULES_JSON"] = data_files["rules_json"]
@@ -57,20 +99,26 @@ def tool_client(agent_settings: AviationAgentSettings) -> AviationToolClient:
     return AviationToolClient(agent_settings.build_tool_context())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_messages() -> list[HumanMessage]:
+    # Read-only: planner and graph build new message lists rather than appending here
     return [
         HumanMessage(content="Need IFR routing from EGTF to LSGS with customs stops."),
     ]
 
 
-@pytest.fixture
+# Stateless stub runnables, shared by every test that requests them
+_PLANNER_STUB_PAYLOAD = '{"selected_tool": "search_airports", "arguments": {"query": "LSGS"}, "answer_style": "markdown"}'
+_PLANNER_LLM_STUB = RunnableLambda(lambda _: _PLANNER_STUB_PAYLOAD)
+_FORMATTER_LLM_STUB = RunnableLambda(lambda _: "Stubbed final answer.")
+
+
+@pytest.fixture(scope="session")
 def planner_llm_stub():
-    payload = '{"selected_tool": "search_airports", "arguments": {"query": "LSGS"}, "answer_style": "markdown"}'
-    return RunnableLambda(lambda _: payload)
+    return _PLANNER_LLM_STUB
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def formatter_llm_stub():
-    return RunnableLambda(lambda _: "Stubbed final answer.")
+    return _FORMATTER_LLM_STUB
 
@@ -10,18 +10,14 @@ and AVIATION_AGENT_FORMATTER_MODEL environment variables, or they will be skippe
 
 from __future__ import annotations
 
-import json
 import os
 from pathlib import Path
+from typing import Any, Dict, Iterator, List
 
 import pytest
 from fastapi.testclient import TestClient
 
-# Import the FastAPI app
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "web" / "server"))
-
-from main import app
+from tests.aviation_agent.conftest import _iter_sse_events
 
 
 @pytest.fixture(scope="session")
@@ -64,212 +60,103 @@ def setup_test_env():
                 break
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    # Use an allowed host to bypass TrustedHostMiddleware
-    return TestClient(app, base_url="http://localhost:8000")
+@pytest.fixture(scope="session")
+def client(setup_test_env) -> Iterator[TestClient]:
+    """Create a test client for the FastAPI app, shared across the session."""
+    # Import the FastAPI app once, after the test environment is configured
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent / "web" / "server"))
+    from main import create_app
 
+    # Without TrustedHostMiddleware requests need no allowed Host header.
+    # Not entered as a context manager: the app lifespan loads the full
+    # airport model, which the agent endpoints do not need here.
+    test_client = TestClient(create_app(enable_trusted_host=False))
+    yield test_client
+    test_client.close()
 
-@pytest.mark.integration
-def test_streaming_endpoint_returns_sse_events(client, api_key_available):
-    """Test that the streaming endpoint returns properly formatted SSE events."""
-    if not api_key_available:
-        pytest.skip("OPENAI_API_KEY not set - skipping integration test")
-    
-    response = client.post(
-        "/api/aviation-agent/chat/stream",
-        json={
-            "messages": [
-                {"role": "user", "content": "Say hello in 3 words"}
-            ]
-        },
-        headers={"Content-Type": "application/json"},
-    )
-    
-    # Agent might be disabled (404), middleware might block (400), or LLM config missing (503)
-    assert response.status_code in [200, 400, 404, 503], f"Unexpected status: {response.status_code}, response: {response.text[:200]}"
+
+STREAM_URL = "/api/aviation-agent/chat/stream"
+
+
+def _skip_if_unavailable(response) -> None:
+    """Skip the test when the agent is disabled or misconfigured."""
+    # Agent might be disabled (404) or LLM config missing (503)
+    if response.status_code != 200:
+        response.read()
+    assert response.status_code in [200, 404, 503], f"Unexpected status: {response.status_code}, response: {response.text[:200]}"
     
     if response.status_code == 404:
         pytest.skip("Aviation agent is disabled")
-    elif response.status_code == 400:
-        pytest.skip("Request blocked by middleware (likely TrustedHostMiddleware)")
     elif response.status_code == 503:
         pytest.skip(f"Agent configuration error: {response.json().get('detail', 'Unknown error')}")
-    
-    assert response.headers["content-type"] == "text/event-stream; charset=utf-8"
-    
-    # Parse SSE events
-    events = []
-    event_type = None
-    for line in response.iter_lines():
-        if line:
-            # TestClient.iter_lines() returns strings, not bytes
-            line_str = line if isinstance(line, str) else line.decode('utf-8')
-            if line_str.startswith('event:'):
-                event_type = line_str.split(':', 1)[1].strip()
-            elif line_str.startswith('data:'):
-                data_str = line_str.split(':', 1)[1].strip()
-                try:
-                    data = json.loads(data_str)
-                    if event_type:
-                        events.append({"event": event_type, "data": data})
-                except json.JSONDecodeError:
-                    pass
-    
-    # Verify we got some events
-    assert len(events) > 0, "Should receive at least one SSE event"
-    
-    # Verify event types
-    event_types = [e["event"] for e in events]
-    assert "plan" in event_types or "message" in event_types or "done" in event_types
 
 
-@pytest.mark.integration
-def test_streaming_endpoint_emits_plan_event(client, api_key_available):
-    """Test that the streaming endpoint emits a plan event."""
+@pytest.fixture(scope="session")
+def sse_events(client, api_key_available) -> List[Dict[str, Any]]:
+    """Stream one canonical conversation and cache its SSE events for the session."""
     if not api_key_available:
         pytest.skip("OPENAI_API_KEY not set - skipping integration test")
     
-    response = client.post(
-        "/api/aviation-agent/chat/stream",
+    with client.stream(
+        "POST",
+        STREAM_URL,
         json={
             "messages": [
                 {"role": "user", "content": "What is airport LFPG?"}
             ]
         },
-    )
-    
-    # Agent might be disabled (404), middleware might block (400), or LLM config missing (503)
-    assert response.status_code in [200, 400, 404, 503], f"Unexpected status: {response.status_code}"
-    if response.status_code == 404:
-        pytest.skip("Aviation agent is disabled")
-    elif response.status_code == 400:
-        pytest.skip("Request blocked by middleware")
-    elif response.status_code == 503:
-        pytest.skip(f"Agent configuration error: {response.json().get('detail', 'Unknown error')}")
-    
-    events = []
-    event_type = None
-    for line in response.iter_lines():
-        if line:
-            # TestClient.iter_lines() returns strings, not bytes
-            line_str = line if isinstance(line, str) else line.decode('utf-8')
-            if line_str.startswith('event:'):
-                event_type = line_str.split(':', 1)[1].strip()
-            elif line_str.startswith('data:'):
-                data_str = line_str.split(':', 1)[1].strip()
-                try:
-                    data = json.loads(data_str)
-                    if event_type:
-                        events.append({"event": event_type, "data": data})
-                        if event_type == "plan":
-                            break  # Stop after plan event
-                except json.JSONDecodeError:
-                    pass
-    
-    plan_events = [e for e in events if e["event"] == "plan"]
-    assert len(plan_events) > 0, "Should emit plan event"
-    assert "selected_tool" in plan_events[0]["data"]
+        headers={"Content-Type": "application/json"},
+    ) as response:
+        _skip_if_unavailable(response)
+        assert response.headers["content-type"] == "text/event-stream; charset=utf-8"
+        
+        events = []
+        for event in _iter_sse_events(response):
+            events.append(event)
+            if event["event"] == "done":
+                break  # Stop after done event
+    return events
 
 
-@pytest.mark.integration
-def test_streaming_endpoint_emits_message_events(client, api_key_available):
-    """Test that the streaming endpoint emits message events."""
-    if not api_key_available:
-        pytest.skip("OPENAI_API_KEY not set - skipping integration test")
-    
-    response = client.post(
-        "/api/aviation-agent/chat/stream",
-        json={
-            "messages": [
-                {"role": "user", "content": "Say hello"}
-            ]
-        },
-    )
-    
-    # Agent might be disabled (404), middleware might block (400), or LLM config missing (503)
-    assert response.status_code in [200, 400, 404, 503], f"Unexpected status: {response.status_code}"
-    if response.status_code == 404:
-        pytest.skip("Aviation agent is disabled")
-    elif response.status_code == 400:
-        pytest.skip("Request blocked by middleware")
-    elif response.status_code == 503:
-        pytest.skip(f"Agent configuration error: {response.json().get('detail', 'Unknown error')}")
-    
-    events = []
-    event_type = None
-    for line in response.iter_lines():
-        if line:
-            # TestClient.iter_lines() returns strings, not bytes
-            line_str = line if isinstance(line, str) else line.decode('utf-8')
-            if line_str.startswith('event:'):
-                event_type = line_str.split(':', 1)[1].strip()
-            elif line_str.startswith('data:'):
-                data_str = line_str.split(':', 1)[1].strip()
-                try:
-                    data = json.loads(data_str)
-                    if event_type:
-                        events.append({"event": event_type, "data": data})
-                        if event_type == "done":
-                            break  # Stop after done event
-                except json.JSONDecodeError:
-                    pass
-    
-    message_events = [e for e in events if e["event"] == "message"]
-    assert len(message_events) > 0, "Should emit message events"
-    
+def _check_plan(events: List[Dict[str, Any]]) -> None:
+    assert "selected_tool" in events[0]["data"]
+
+
+def _check_message(events: List[Dict[str, Any]]) -> None:
     # Verify message events have content
-    for event in message_events:
+    for event in events:
         assert "content" in event["data"]
 
 
+def _check_done(events: List[Dict[str, Any]]) -> None:
+    tokens = events[0]["data"].get("tokens")
+    assert tokens is not None
+    assert "input" in tokens
+    assert "output" in tokens
+
+
 @pytest.mark.integration
-def test_streaming_endpoint_emits_done_event(client, api_key_available):
-    """Test that the streaming endpoint emits done event with tokens."""
-    if not api_key_available:
-        pytest.skip("OPENAI_API_KEY not set - skipping integration test")
-    
-    response = client.post(
-        "/api/aviation-agent/chat/stream",
-        json={
-            "messages": [
-                {"role": "user", "content": "Say hello"}
-            ]
-        },
-    )
-    
-    # Agent might be disabled (404), middleware might block (400), or LLM config missing (503)
-    assert response.status_code in [200, 400, 404, 503], f"Unexpected status: {response.status_code}"
-    if response.status_code == 404:
-        pytest.skip("Aviation agent is disabled")
-    elif response.status_code == 400:
-        pytest.skip("Request blocked by middleware")
-    elif response.status_code == 503:
-        pytest.skip(f"Agent configuration error: {response.json().get('detail', 'Unknown error')}")
-    
-    done_event = None
-    event_type = None
-    for line in response.iter_lines():
-        if line:
-            # TestClient.iter_lines() returns strings, not bytes
-            line_str = line if isinstance(line, str) else line.decode('utf-8')
-            if line_str.startswith('event:'):
-                event_type = line_str.split(':', 1)[1].strip()
-            elif line_str.startswith('data:'):
-                data_str = line_str.split(':', 1)[1].strip()
-                try:
-                    data = json.loads(data_str)
-                    if event_type == "done":
-                        done_event = {"event": event_type, "data": data}
-                        break
-                except json.JSONDecodeError:
-                    pass
-    
-    assert done_event is not None, "Should emit done event"
-    assert "tokens" in done_event["data"]
-    assert "input" in done_event["data"]["tokens"]
-    assert "output" in done_event["data"]["tokens"]
+def test_streaming_endpoint_returns_sse_events(sse_events):
+    """Test that the streaming endpoint returns properly formatted SSE events."""
+    assert len(sse_events) > 0, "Should receive at least one SSE event"
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "expected_event, validate",
+    [
+        ("plan", _check_plan),
+        ("message", _check_message),
+        ("done", _check_done),
+    ],
+    ids=["plan", "message", "done"],
+)
+def test_streaming_endpoint_emits_event(sse_events, expected_event, validate):
+    """Test that the streaming endpoint emits plan, message and done events."""
+    matching = [e for e in sse_events if e["event"] == expected_event]
+    assert len(matching) > 0, f"Should emit {expected_event} event"
+    validate(matching)
 
 
 @pytest.mark.integration
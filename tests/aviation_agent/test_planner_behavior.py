@@ -11,6 +11,10 @@ Run with:
 
 Or set environment variable:
     RUN_PLANNER_BEHAVIOR_TESTS=1 pytest tests/aviation_agent/test_planner_behavior.py
+
+Cases are independent live-LLM calls, so they can run in parallel with pytest-xdist
+(each worker builds its own LLM client and planner once):
+    RUN_PLANNER_BEHAVIOR_TESTS=1 pytest -m planner_behavior -n auto
 """
 from __future__ import annotations
 
@@ -18,8 +22,10 @@ import csv
 import json
 import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 import pytest
 from langchain_core.messages import HumanMessage
@@ -33,13 +39,16 @@ from shared.aviation_agent.tools import AviationToolClient
 _test_results: list[Dict[str, Any]] = []
 
 
-def _load_test_cases() -> list[Dict[str, Any]]:
-    """Load test cases from JSON fixture file."""
+@lru_cache(maxsize=1)
+def _load_test_cases() -> Tuple[Mapping[str, Any], ...]:
+    """Load test cases from JSON fixture file (read once per process, read-only)."""
     fixture_path = Path(__file__).parent / "fixtures" / "planner_test_cases.json"
-    with open(fixture_path) as f:
-        all_cases = json.load(f)
+    all_cases = json.loads(fixture_path.read_bytes())
     # Filter out comment-only entries (those without a "question" field)
-    return [tc for tc in all_cases if "question" in tc]
+    return tuple(MappingProxyType(tc) for tc in all_cases if "question" in tc)
+
+
+_TEST_CASES = _load_test_cases()
 
 
 def _should_run_behavior_tests() -> bool:
@@ -68,6 +77,73 @@ def behavior_tool_client(agent_settings):
     return AviationToolClient(agent_settings.build_tool_context())
 
 
+@pytest.fixture(scope="session")
+def behavior_planner(live_planner_llm, behavior_tool_client: AviationToolClient):
+    """Planner built once per session (per worker under pytest-xdist)."""
+    # Get available tags from rules manager for dynamic prompt injection
+    available_tags = None
+    if behavior_tool_client._context.rules_manager:
+        available_tags = behavior_tool_client._context.rules_manager.get_available_tags()
+
+    return build_planner_runnable(
+        live_planner_llm,
+        tuple(behavior_tool_client.tools.values()),
+        available_tags=available_tags,
+    )
+
+
+@pytest.fixture(scope="session")
+def planner_batch_results(request, behavior_planner) -> Optional[Dict[str, Any]]:
+    """
+    Plans for all selected cases, fetched concurrently with one planner.batch() call.
+
+    Each question still gets its own planner call with the production prompt; only
+    the round-trips overlap. Returns None under pytest-xdist, which already spreads
+    cases across workers.
+    """
+    if os.getenv("PYTEST_XDIST_WORKER"):
+        return None
+
+    # Only batch the cases selected for this run (respects -k / node id selection)
+    questions = list(dict.fromkeys(
+        item.callspec.params["planned"]["question"]
+        for item in request.session.items
+        if getattr(item, "callspec", None) and "planned" in item.callspec.params
+    ))
+    plans = behavior_planner.batch(
+        [{"messages": [HumanMessage(content=q)]} for q in questions],
+        config={"max_concurrency": 8},
+        return_exceptions=True,
+    )
+    return dict(zip(questions, plans))
+
+
+# Plans already produced this session, keyed by question
+_plans: Dict[str, Any] = {}
+
+
+@pytest.fixture
+def planned(request, behavior_planner, planner_batch_results: Optional[Dict[str, Any]]):
+    """
+    (test_case, plan) for an indirectly parametrized case.
+
+    The planner runs at most once per question, so several assertion tests
+    parametrized over the same cases share a single LLM call.
+    """
+    test_case = request.param
+    question = test_case["question"]
+    plan = _plans.get(question)
+    if plan is None:
+        # Use the batched plan when available, otherwise run the planner for this case
+        plan = planner_batch_results.get(question) if planner_batch_results else None
+        if plan is None:
+            plan = behavior_planner.invoke({"messages": [HumanMessage(content=question)]})
+        elif isinstance(plan, Exception):
+            raise plan
+        _plans[question] = plan
+    return test_case, plan
+
+
 def _save_results_to_csv():
     """Save collected test results to CSV file."""
     if not _test_results:
@@ -77,7 +153,10 @@ def _save_results_to_csv():
     output_dir.mkdir(exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    csv_path = output_dir / f"planner_test_results_{timestamp}.csv"
+    # pytest-xdist workers each collect their own results; keep their files apart
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    suffix = f"_{worker}" if worker else ""
+    csv_path = output_dir / f"planner_test_results_{timestamp}{suffix}.csv"
 
     fieldnames = [
         "test_case", "question", "description", "status",
@@ -104,17 +183,16 @@ def save_csv_on_finish(request):
 
 
 @pytest.mark.planner_behavior
-@pytest.mark.parametrize("test_case", _load_test_cases(), ids=lambda tc: tc.get("question", "")[:40])
-def test_planner_selects_correct_tool(
-    test_case: Dict[str, Any],
-    live_planner_llm,
-    behavior_tool_client: AviationToolClient,
-):
+@pytest.mark.parametrize(
+    "planned", _TEST_CASES, indirect=True, ids=lambda tc: tc.get("question", "")[:40]
+)
+def test_planner_selects_correct_tool(planned):
     """
     Test that planner selects the expected tool for a given question.
 
     This is a behavioral/integration test that requires a live LLM.
     """
+    test_case, plan = planned
     question = test_case["question"]
     expected_tool_raw = test_case["expected_tool"]
     expected_args_raw = test_case.get("expected_arguments", {})
@@ -129,22 +207,6 @@ def test_planner_selects_correct_tool(
         expected_tools = [expected_tool_raw]
         expected_args_list = [expected_args_raw]
 
-    # Get available tags from rules manager for dynamic prompt injection
-    available_tags = None
-    if behavior_tool_client._context.rules_manager:
-        available_tags = behavior_tool_client._context.rules_manager.get_available_tags()
-
-    # Build planner with live LLM
-    planner = build_planner_runnable(
-        live_planner_llm,
-        tuple(behavior_tool_client.tools.values()),
-        available_tags=available_tags,
-    )
-
-    # Run planner
-    messages = [HumanMessage(content=question)]
-    plan = planner.invoke({"messages": messages})
-
     # Determine if tool matches any valid option
     plan_args = plan.arguments or {}
     tool_match = False
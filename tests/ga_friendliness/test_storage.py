@@ -92,6 +92,17 @@ class TestStorageAirfieldStats:
         result = temp_storage.get_airfield_stats("XXXX")
         assert result is None
 
+    def test_get_stats_batch(self, temp_storage, sample_airport_stats):
+        """Test reading stats for several airports at once."""
+        temp_storage.write_airfield_stats(sample_airport_stats)
+        temp_storage.write_airfield_stats(
+            sample_airport_stats.model_copy(update={"icao": "LFAT"})
+        )
+
+        result = temp_storage.get_airfield_stats_batch(["EGKB", "LFAT", "XXXX", "EGKB"])
+        assert set(result) == {"EGKB", "LFAT"}
+        assert result["LFAT"].review_cost_score == 0.65
+
     def test_get_all_icaos(self, temp_storage, sample_airport_stats):
         """Test getting all ICAOs."""
         temp_storage.write_airfield_stats(sample_airport_stats)
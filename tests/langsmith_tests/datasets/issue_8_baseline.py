@@ -217,14 +217,20 @@ ALL_TEST_CASES = (
 )
 
 
+# Lookup indexes, built once at import
+_INDEX = {tc["id"]: tc for tc in ALL_TEST_CASES}
+_BY_CATEGORY = {}
+for _tc in ALL_TEST_CASES:
+    _BY_CATEGORY.setdefault(_tc["category"], []).append(_tc)
+del _tc
+_BY_CATEGORY = {category: tuple(cases) for category, cases in _BY_CATEGORY.items()}
+
+
 def get_test_cases_by_category(category: str):
     """Get test cases filtered by category"""
-    return [tc for tc in ALL_TEST_CASES if tc["category"] == category]
+    return _BY_CATEGORY.get(category, ())
 
 
 def get_test_case_by_id(test_id: str):
     """Get a specific test case by ID"""
-    for tc in ALL_TEST_CASES:
-        if tc["id"] == test_id:
-            return tc
-    return None
+    return _INDEX.get(test_id)
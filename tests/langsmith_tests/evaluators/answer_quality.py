@@ -4,197 +4,206 @@ Answer Quality Evaluator
 Evaluates the quality and completeness of the final formatted answer.
 """
 
-from typing import Dict, Any, List
+from functools import wraps
+from typing import Callable, Dict, Any, Set, Tuple
 import re
 
+# ICAO codes are 4 letters/digits, starting with a letter (matched in any case)
+ICAO_PATTERN = re.compile(r'\b[A-Za-z][A-Za-z0-9]{3}\b')
 
-def extract_icao_codes(text: str) -> List[str]:
-    """Extract ICAO codes from text (4-letter codes starting with letter)"""
-    # ICAO codes are 4 uppercase letters, starting with a letter
-    pattern = r'\b[A-Z][A-Z0-9]{3}\b'
-    return list(set(re.findall(pattern, text.upper())))
+# Bold markdown checked by evaluate_answer_format (headers/lists use line scans)
+MD_BOLD_PATTERN = re.compile(r'\*\*\w+\*\*')
 
+# Whitespace-separated words, as str.split() counts them
+WORD_PATTERN = re.compile(r'\S+')
 
-def evaluate_answer_mentions(run: Any, example: Any) -> Dict[str, Any]:
+
+def extract_icao_codes(text: str) -> Set[str]:
+    """Extract uppercased ICAO codes from text (4-letter codes starting with letter)"""
+    # Uppercase only the short matches instead of copying the whole text
+    return {code.upper() for code in ICAO_PATTERN.findall(text)}
+
+
+def _scan_headers_and_lists(text: str) -> Tuple[bool, bool]:
+    """Detect '#'-'###' headers and '-'/'*' list items in one pass over the lines."""
+    has_headers = False
+    has_lists = False
+    for line in text.split("\n"):
+        if not has_headers:
+            level = len(line) - len(line.lstrip("#"))
+            has_headers = 1 <= level <= 3 and line[level:level + 1].isspace()
+        if not has_lists:
+            item = line.lstrip()
+            has_lists = item[:1] in ("-", "*") and item[1:2].isspace()
+        if has_headers and has_lists:
+            break
+    return has_headers, has_lists
+
+
+def requires_final_answer(key: str, empty_comment: str = "No answer") -> Callable:
+    """
+    Turn an evaluator of (final_answer, example) into a LangSmith (run, example) evaluator.
+
+    The wrapper extracts the final answer once, scores 0.0 when it is empty and
+    reports any exception as a 0.0 result under the same key.
+    """
+    def decorator(evaluate_fn: Callable[[str, Any], Dict[str, Any]]) -> Callable:
+        @wraps(evaluate_fn)
+        def wrapper(run: Any, example: Any) -> Dict[str, Any]:
+            try:
+                outputs = run.outputs or {}
+                final_answer = outputs.get("final_answer", "")
+
+                if not final_answer:
+                    return {"key": key, "score": 0.0, "comment": empty_comment}
+
+                return evaluate_fn(final_answer, example)
+
+            except Exception as e:
+                return {"key": key, "score": 0.0, "comment": f"Error: {str(e)}"}
+
+        # LangSmith maps evaluator arguments from the signature; expose (run, example)
+        del wrapper.__wrapped__
+        return wrapper
+    return decorator
+
+
+@requires_final_answer("answer_mentions", empty_comment="No final answer generated")
+def evaluate_answer_mentions(final_answer: str, example: Any) -> Dict[str, Any]:
     """
     Check if the answer mentions expected keywords or ICAO codes.
 
     Args:
-        run: LangSmith run object
+        final_answer: Non-empty final answer from the run
         example: Test case with should_mention/should_include_icaos
 
     Returns:
         Evaluation result
     """
-    try:
-        outputs = run.outputs or {}
-        final_answer = outputs.get("final_answer", "")
-
-        if not final_answer:
-            return {
-                "key": "answer_mentions",
-                "score": 0.0,
-                "comment": "No final answer generated"
-            }
-
-        expected = example.outputs.get("expected", {})
-        should_mention = expected.get("should_mention", [])
-        should_include_icaos = expected.get("should_include_icaos", [])
-        should_not_include = expected.get("should_not_include", [])
-
-        if not should_mention and not should_include_icaos and not should_not_include:
-            return {
-                "key": "answer_mentions",
-                "score": None,
-                "comment": "No mention expectations defined"
-            }
-
-        # Check keyword mentions
-        answer_lower = final_answer.lower()
-        mentioned_keywords = [kw for kw in should_mention if kw.lower() in answer_lower]
-        missing_keywords = [kw for kw in should_mention if kw.lower() not in answer_lower]
-
-        # Check ICAO codes
-        mentioned_icaos = extract_icao_codes(final_answer)
-        expected_icaos_found = [icao for icao in should_include_icaos if icao in mentioned_icaos]
-        expected_icaos_missing = [icao for icao in should_include_icaos if icao not in mentioned_icaos]
-
-        # Check exclusions
-        unwanted_icaos = [icao for icao in should_not_include if icao in mentioned_icaos]
-
-        # Calculate score
-        total_expected = len(should_mention) + len(should_include_icaos)
-        total_found = len(mentioned_keywords) + len(expected_icaos_found)
-        score = (total_found / total_expected) if total_expected > 0 else 1.0
-
-        # Penalize for unwanted mentions
-        if unwanted_icaos:
-            score = max(0.0, score - 0.2 * len(unwanted_icaos))
-
-        # Build comment
-        comments = []
-        if mentioned_keywords:
-            comments.append(f"Keywords: {', '.join(mentioned_keywords)}")
-        if missing_keywords:
-            comments.append(f"Missing: {', '.join(missing_keywords)}")
-        if expected_icaos_found:
-            comments.append(f"ICAOs: {', '.join(expected_icaos_found)}")
-        if expected_icaos_missing:
-            comments.append(f"Missing ICAOs: {', '.join(expected_icaos_missing)}")
-        if unwanted_icaos:
-            comments.append(f"❌ Unwanted: {', '.join(unwanted_icaos)}")
+    expected = example.outputs.get("expected", {})
+    should_mention = expected.get("should_mention", [])
+    should_include_icaos = expected.get("should_include_icaos", [])
+    should_not_include = expected.get("should_not_include", [])
 
+    if not should_mention and not should_include_icaos and not should_not_include:
         return {
             "key": "answer_mentions",
-            "score": score,
-            "comment": " | ".join(comments) if comments else "All mentions correct ✓"
+            "score": None,
+            "comment": "No mention expectations defined"
         }
 
-    except Exception as e:
-        return {
-            "key": "answer_mentions",
-            "score": 0.0,
-            "comment": f"Error: {str(e)}"
-        }
-
-
-def evaluate_answer_length(run: Any, example: Any) -> Dict[str, Any]:
+    # Check keyword mentions
+    answer_lower = final_answer.lower()
+    mentioned_keywords = []
+    missing_keywords = []
+    for kw in should_mention:
+        (mentioned_keywords if kw.lower() in answer_lower else missing_keywords).append(kw)
+
+    # Check ICAO codes
+    mentioned_icaos = extract_icao_codes(final_answer)
+    expected_icaos_found = []
+    expected_icaos_missing = []
+    for icao in should_include_icaos:
+        (expected_icaos_found if icao in mentioned_icaos else expected_icaos_missing).append(icao)
+
+    # Check exclusions
+    unwanted_icaos = [icao for icao in should_not_include if icao in mentioned_icaos]
+
+    # Calculate score
+    total_expected = len(should_mention) + len(should_include_icaos)
+    total_found = len(mentioned_keywords) + len(expected_icaos_found)
+    score = (total_found / total_expected) if total_expected > 0 else 1.0
+
+    # Penalize for unwanted mentions
+    if unwanted_icaos:
+        score = max(0.0, score - 0.2 * len(unwanted_icaos))
+
+    # Build comment
+    comments = []
+    if mentioned_keywords:
+        comments.append(f"Keywords: {', '.join(mentioned_keywords)}")
+    if missing_keywords:
+        comments.append(f"Missing: {', '.join(missing_keywords)}")
+    if expected_icaos_found:
+        comments.append(f"ICAOs: {', '.join(expected_icaos_found)}")
+    if expected_icaos_missing:
+        comments.append(f"Missing ICAOs: {', '.join(expected_icaos_missing)}")
+    if unwanted_icaos:
+        comments.append(f"❌ Unwanted: {', '.join(unwanted_icaos)}")
+
+    return {
+        "key": "answer_mentions",
+        "score": score,
+        "comment": " | ".join(comments) if comments else "All mentions correct ✓"
+    }
+
+
+@requires_final_answer("answer_length")
+def evaluate_answer_length(final_answer: str, example: Any) -> Dict[str, Any]:
     """
     Check if the answer has reasonable length (not too short, not too verbose).
 
     Args:
-        run: LangSmith run object
+        final_answer: Non-empty final answer from the run
         example: Test case
 
     Returns:
         Evaluation result
     """
-    try:
-        outputs = run.outputs or {}
-        final_answer = outputs.get("final_answer", "")
-
-        if not final_answer:
-            return {
-                "key": "answer_length",
-                "score": 0.0,
-                "comment": "No answer"
-            }
-
-        word_count = len(final_answer.split())
-
-        # Scoring based on length
-        if word_count < 10:
-            score = 0.3
-            comment = f"Too short ({word_count} words)"
-        elif word_count > 500:
-            score = 0.7
-            comment = f"Too verbose ({word_count} words)"
-        elif word_count < 30:
-            score = 0.7
-            comment = f"Brief ({word_count} words)"
-        else:
-            score = 1.0
-            comment = f"Good length ({word_count} words)"
-
-        return {
-            "key": "answer_length",
-            "score": score,
-            "comment": comment
-        }
-
-    except Exception as e:
-        return {
-            "key": "answer_length",
-            "score": 0.0,
-            "comment": f"Error: {str(e)}"
-        }
-
-
-def evaluate_answer_format(run: Any, example: Any) -> Dict[str, Any]:
+    word_count = sum(1 for _ in WORD_PATTERN.finditer(final_answer))
+
+    # Scoring based on length
+    if word_count < 10:
+        score = 0.3
+        comment = f"Too short ({word_count} words)"
+    elif word_count > 500:
+        score = 0.7
+        comment = f"Too verbose ({word_count} words)"
+    elif word_count < 30:
+        score = 0.7
+        comment = f"Brief ({word_count} words)"
+    else:
+        score = 1.0
+        comment = f"Good length ({word_count} words)"
+
+    return {
+        "key": "answer_length",
+        "score": score,
+        "comment": comment
+    }
+
+
+@requires_final_answer("answer_format")
+def evaluate_answer_format(final_answer: str, example: Any) -> Dict[str, Any]:
     """
     Check if the answer is properly formatted (markdown, structure).
 
     Args:
-        run: LangSmith run object
+        final_answer: Non-empty final answer from the run
         example: Test case
 
     Returns:
         Evaluation result
     """
-    try:
-        outputs = run.outputs or {}
-        final_answer = outputs.get("final_answer", "")
-
-        if not final_answer:
-            return {"key": "answer_format", "score": 0.0, "comment": "No answer"}
-
-        # Check for markdown formatting
-        has_headers = bool(re.search(r'^#{1,3}\s', final_answer, re.MULTILINE))
-        has_lists = bool(re.search(r'^\s*[-*]\s', final_answer, re.MULTILINE))
-        has_bold = bool(re.search(r'\*\*\w+\*\*', final_answer))
-
-        formatting_score = sum([has_headers, has_lists, has_bold]) / 3
-
-        comments = []
-        if has_headers:
-            comments.append("Headers ✓")
-        if has_lists:
-            comments.append("Lists ✓")
-        if has_bold:
-            comments.append("Bold ✓")
-
-        if not comments:
-            comments.append("No markdown formatting")
-
-        return {
-            "key": "answer_format",
-            "score": formatting_score,
-            "comment": ", ".join(comments)
-        }
-
-    except Exception as e:
-        return {
-            "key": "answer_format",
-            "score": 0.0,
-            "comment": f"Error: {str(e)}"
-        }
+    # Check for markdown formatting
+    has_headers, has_lists = _scan_headers_and_lists(final_answer)
+    has_bold = bool(MD_BOLD_PATTERN.search(final_answer))
+
+    formatting_score = sum([has_headers, has_lists, has_bold]) / 3
+
+    comments = []
+    if has_headers:
+        comments.append("Headers ✓")
+    if has_lists:
+        comments.append("Lists ✓")
+    if has_bold:
+        comments.append("Bold ✓")
+
+    if not comments:
+        comments.append("No markdown formatting")
+
+    return {
+        "key": "answer_format",
+        "score": formatting_score,
+        "comment": ", ".join(comments)
+    }
@@ -4,7 +4,9 @@ Filter Extraction Evaluator
 Checks if the aviation agent correctly extracted filters from natural language queries.
 """
 
-from typing import Dict, Any, Set
+from typing import Dict, Any, List, Set, Tuple
+
+_MISSING = object()
 
 
 def normalize_filter_value(value: Any) -> Any:
@@ -14,6 +16,33 @@ def normalize_filter_value(value: Any) -> Any:
     return value
 
 
+def _compare_filters(
+    actual_filters: Dict[str, Any], expected_filters: Dict[str, Any]
+) -> Tuple[int, List[str], List[str], List[str]]:
+    """
+    Compare actual against expected filters in one pass over each.
+
+    Returns:
+        (correct_count, missing keys, incorrect descriptions, extra keys)
+    """
+    missing_filters = []
+    incorrect_filters = []
+    correct_count = 0
+
+    for key, expected_value in expected_filters.items():
+        actual_value = actual_filters.get(key, _MISSING)
+        if actual_value is _MISSING:
+            missing_filters.append(key)
+        # Normalize for comparison (case-insensitive for strings)
+        elif normalize_filter_value(actual_value) == normalize_filter_value(expected_value):
+            correct_count += 1
+        else:
+            incorrect_filters.append(f"{key}: expected {expected_value}, got {actual_value}")
+
+    extra_filters = [key for key in actual_filters if key not in expected_filters]
+    return correct_count, missing_filters, incorrect_filters, extra_filters
+
+
 def evaluate_filter_extraction(run: Any, example: Any) -> Dict[str, Any]:
     """
     Evaluate if the planner correctly extracted filters from the user query.
@@ -52,20 +81,9 @@ def evaluate_filter_extraction(run: Any, example: Any) -> Dict[str, Any]:
             }
 
         # Compare filters
-        missing_filters = []
-        incorrect_filters = []
-        correct_count = 0
-
-        for key, expected_value in expected_filters.items():
-            if key not in actual_filters:
-                missing_filters.append(key)
-            else:
-                actual_value = actual_filters[key]
-                # Normalize for comparison (case-insensitive for strings)
-                if normalize_filter_value(actual_value) == normalize_filter_value(expected_value):
-                    correct_count += 1
-                else:
-                    incorrect_filters.append(f"{key}: expected {expected_value}, got {actual_value}")
+        correct_count, missing_filters, incorrect_filters, _ = _compare_filters(
+            actual_filters, expected_filters
+        )
 
         total_expected = len(expected_filters)
         score = correct_count / total_expected if total_expected > 0 else 0.0
@@ -112,14 +130,12 @@ def evaluate_filter_completeness(run: Any, example: Any) -> Dict[str, Any]:
         expected = example.outputs.get("expected", {})
         expected_filters = expected.get("filters", {})
 
-        # Check for any extra unexpected filters (could be good or bad)
-        extra_filters = set(actual_filters.keys()) - set(expected_filters.keys())
-
         if not expected_filters:
             return {"key": "filter_completeness", "score": None, "comment": "No expected filters"}
 
-        # Score based on having all required filters
-        has_all = all(key in actual_filters for key in expected_filters.keys())
+        # Extra unexpected filters could be good or bad; score on having all required ones
+        _, missing_filters, _, extra_filters = _compare_filters(actual_filters, expected_filters)
+        has_all = not missing_filters
 
         comment = "Complete ✓" if has_all else "Missing some filters"
         if extra_filters:
@@ -6,6 +6,9 @@ Checks if the aviation agent planner selected the correct tool for a given query
 
 from typing import Dict, Any, Optional
 
+# tool_result keys that carry actual results, across tool types
+RESULT_KEYS = ("airports", "routes", "borders")
+
 
 def evaluate_tool_selection(run: Any, example: Any) -> Dict[str, Any]:
     """
@@ -95,9 +98,9 @@ def evaluate_tool_execution(run: Any, example: Any) -> Dict[str, Any]:
             }
 
         # Check if tool returned results
-        has_results = False
-        if isinstance(tool_result, dict):
-            has_results = bool(tool_result.get("airports") or tool_result.get("routes") or tool_result.get("borders"))
+        has_results = isinstance(tool_result, dict) and any(
+            tool_result.get(key) for key in RESULT_KEYS
+        )
 
         return {
             "key": "tool_execution",
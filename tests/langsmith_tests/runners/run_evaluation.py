@@ -13,8 +13,9 @@ Usage:
 import argparse
 import os
 import sys
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Iterable, List, Dict, Any, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -47,18 +48,66 @@ from tests.langsmith_tests.evaluators.answer_quality import (
 from shared.aviation_agent.adapters import run_aviation_agent
 from shared.aviation_agent.config import get_settings
 
+# Examples per create_examples request, to stay under LangSmith payload limits
+EXAMPLE_UPLOAD_BATCH_SIZE = 100
 
-def create_langsmith_dataset(dataset_name: str, test_cases: List[Dict[str, Any]]):
+# Every evaluator applied to each example, in reporting order
+EVALUATORS = (
+    evaluate_tool_selection,
+    evaluate_tool_execution,
+    evaluate_filter_extraction,
+    evaluate_filter_completeness,
+    evaluate_answer_mentions,
+    evaluate_answer_length,
+    evaluate_answer_format,
+)
+
+
+def evaluate_all(run: Any, example: Any) -> Dict[str, Any]:
+    """
+    Run every evaluator on one example as a single LangSmith evaluator.
+
+    LangSmith traces each evaluator call separately; fusing them records one
+    evaluator run per example while still reporting each result under its own key.
+    Each evaluator handles its own errors, so one failure does not hide the others.
+    """
+    return {"results": [evaluator(run, example) for evaluator in EVALUATORS]}
+
+
+def _to_example(test_case: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a test case into a LangSmith example payload."""
+    return {
+        "inputs": test_case["inputs"],
+        "outputs": test_case.get("expected", {}),
+        "metadata": {
+            "test_id": test_case["id"],
+            "category": test_case["category"],
+            "description": test_case.get("description", ""),
+        },
+    }
+
+
+def create_langsmith_dataset(
+    dataset_name: str,
+    test_cases: Iterable[Dict[str, Any]],
+    client: Optional[Client] = None,
+    count: Optional[int] = None,
+):
     """
     Create a LangSmith dataset from test cases.
 
     Args:
         dataset_name: Name for the dataset
-        test_cases: List of test case dictionaries
+        test_cases: Test case dictionaries; any iterable, consumed one upload batch at a time
+        client: LangSmith client to reuse (a new one is created if omitted)
+        count: Number of test cases, for the description (defaults to len(test_cases) if sized)
     """
-    client = Client()
+    client = client or Client()
+    if count is None and hasattr(test_cases, "__len__"):
+        count = len(test_cases)
+    count_label = f"{count} " if count is not None else ""
 
-    print(f"Creating dataset '{dataset_name}' with {len(test_cases)} test cases...")
+    print(f"Creating dataset '{dataset_name}' with {count_label}test cases...")
 
     # Check if dataset already exists
     try:
@@ -73,23 +122,19 @@ def create_langsmith_dataset(dataset_name: str, test_cases: List[Dict[str, Any]]
     # Create new dataset
     dataset = client.create_dataset(
         dataset_name=dataset_name,
-        description=f"Test cases for aviation agent evaluation ({len(test_cases)} cases)",
+        description="Test cases for aviation agent evaluation"
+        + (f" ({count} cases)" if count is not None else ""),
     )
 
-    # Add examples
-    for test_case in test_cases:
-        client.create_example(
-            dataset_id=dataset.id,
-            inputs=test_case["inputs"],
-            outputs=test_case.get("expected", {}),
-            metadata={
-                "test_id": test_case["id"],
-                "category": test_case["category"],
-                "description": test_case.get("description", ""),
-            },
-        )
-
-    print(f"✓ Dataset '{dataset_name}' created with {len(test_cases)} examples")
+    # Add examples in bulk requests rather than one round-trip per example,
+    # holding only one batch in memory at a time
+    cases = iter(test_cases)
+    uploaded = 0
+    while batch := [_to_example(tc) for tc in islice(cases, EXAMPLE_UPLOAD_BATCH_SIZE)]:
+        client.create_examples(dataset_id=dataset.id, examples=batch)
+        uploaded += len(batch)
+
+    print(f"✓ Dataset '{dataset_name}' created with {uploaded} examples")
     print(f"  View at: https://smith.langchain.com/datasets")
 
     return dataset
@@ -98,7 +143,8 @@ def create_langsmith_dataset(dataset_name: str, test_cases: List[Dict[str, Any]]
 def run_evaluation_suite(
     dataset_name: str,
     experiment_prefix: str = "aviation-agent-eval",
-    max_concurrency: int = 1,
+    max_concurrency: int = 8,
+    client: Optional[Client] = None,
 ):
     """
     Run full evaluation suite against a dataset.
@@ -106,7 +152,10 @@ def run_evaluation_suite(
     Args:
         dataset_name: Name of the LangSmith dataset
         experiment_prefix: Prefix for experiment name
-        max_concurrency: Maximum number of concurrent evaluations
+        max_concurrency: Maximum number of concurrent evaluations. Examples run
+            in worker threads, so their LLM round-trips overlap; the evaluators
+            are pure functions of (run, example) and safe to run in parallel.
+        client: LangSmith client to reuse (evaluate creates one if omitted)
     """
     settings = get_settings()
 
@@ -161,17 +210,10 @@ def run_evaluation_suite(
     results = evaluate(
         aviation_agent_predict,
         data=dataset_name,
-        evaluators=[
-            evaluate_tool_selection,
-            evaluate_tool_execution,
-            evaluate_filter_extraction,
-            evaluate_filter_completeness,
-            evaluate_answer_mentions,
-            evaluate_answer_length,
-            evaluate_answer_format,
-        ],
+        evaluators=[evaluate_all],
         experiment_prefix=experiment_prefix,
         max_concurrency=max_concurrency,
+        client=client,
     )
 
     print(f"\n{'='*60}")
@@ -215,8 +257,8 @@ def main():
     parser.add_argument(
         "--concurrency",
         type=int,
-        default=1,
-        help="Maximum concurrent evaluations (default: 1 for sequential)",
+        default=8,
+        help="Maximum concurrent evaluations (default: 8, use 1 for sequential)",
     )
     parser.add_argument(
         "--list-categories",
@@ -252,15 +294,19 @@ def main():
         test_cases = ALL_TEST_CASES
         print(f"Using all {len(test_cases)} test cases")
 
+    # One client (and connection pool) for dataset creation and evaluation
+    client = Client()
+
     # Create dataset if requested
     if args.create_dataset:
-        create_langsmith_dataset(args.dataset, test_cases)
+        create_langsmith_dataset(args.dataset, test_cases, client=client)
 
     # Run evaluation
     run_evaluation_suite(
         dataset_name=args.dataset,
         experiment_prefix=args.experiment,
         max_concurrency=args.concurrency,
+        client=client,
     )
 
 
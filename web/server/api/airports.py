@@ -56,6 +56,14 @@ def _get_notification_summaries_batch(icaos: List[str]) -> Dict[str, Notificatio
         return {}
 
 
+# AIP values meaning "not available", ignored by every operator
+_NEGATIVE_AIP_VALUES = frozenset(["nil", "none", "na", "n/a", "no", "not available", "unavailable"])
+
+# Fuel fields and the spellings that count as AVGAS for value="avgas"
+_FUEL_AIP_FIELDS = frozenset(["fuel and oil types", "fuel types", "fuel"])
+_AVGAS_TERMS = ("avgas", "100ll", "100 ll", "100/ll")
+
+
 def _matches_aip_field(airport: Airport, field_name: str, value: Optional[str] = None, operator: str = "contains") -> bool:
     """
     Check if an airport matches AIP field criteria.
@@ -69,26 +77,25 @@ def _matches_aip_field(airport: Airport, field_name: str, value: Optional[str] =
     Returns:
         True if airport matches the criteria
     """
-    # Get all entries for this field
-    field_entries = [entry for entry in airport.aip_entries if entry.std_field == field_name]
-    
-    if not field_entries:
-        return False
-    
-    # Check each entry value
-    for entry in field_entries:
+    # Lower-case the search value once rather than per entry
+    search_value = value.lower() if value else ""
+    avgas_search = search_value == "avgas" and field_name.lower() in _FUEL_AIP_FIELDS
+
+    # Check each entry value for this field
+    for entry in airport.aip_entries:
+        if entry.std_field != field_name:
+            continue
         entry_value = entry.value.lower() if entry.value else ""
-        search_value = value.lower() if value else ""
         
         # Handle negative values that should return False
-        if entry_value in ["nil", "none", "na", "n/a", "no", "not available", "unavailable"]:
+        if entry_value in _NEGATIVE_AIP_VALUES:
             continue  # Skip this entry, it's a negative value
         
         if operator == "contains":
             # Special handling for AVGAS detection
-            if search_value == "avgas" and field_name.lower() in ["fuel and oil types", "fuel types", "fuel"]:
+            if avgas_search:
                 # Check for various AVGAS/100LL variations
-                if any(avgas_term in entry_value for avgas_term in ["avgas", "100ll", "100 ll", "100/ll"]):
+                if any(avgas_term in entry_value for avgas_term in _AVGAS_TERMS):
                     return True
             else:
                 # Standard contains logic
@@ -98,8 +105,8 @@ def _matches_aip_field(airport: Airport, field_name: str, value: Optional[str] =
             if entry_value == search_value:
                 return True
         elif operator == "not_empty":
-            # Enhanced not_empty logic - exclude negative values
-            if entry_value and entry_value not in ["nil", "none", "na", "n/a", "no", "not available", "unavailable", ""]:
+            # Negative values were skipped above
+            if entry_value:
                 return True
         elif operator == "starts_with":
             if entry_value.startswith(search_value):
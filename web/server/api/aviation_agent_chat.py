@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
+import secrets
 import time
-import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 from shared.aviation_agent.adapters import (
@@ -27,7 +30,17 @@ from shared.aviation_agent.adapters.logging import (
 )
 from shared.aviation_agent.config import AviationAgentSettings, get_settings
 
-router = APIRouter(tags=["aviation-agent"])
+# Optional fast JSON encoder for SSE payloads and JSON responses
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+router = APIRouter(
+    tags=["aviation-agent"],
+    default_response_class=ORJSONResponse if HAS_ORJSON else JSONResponse,
+)
 logger = logging.getLogger(__name__)
 
 # Lazy-loaded LangSmith client for feedback
@@ -47,9 +60,76 @@ def _get_langsmith_client():
     return _langsmith_client
 
 
+# Compiled agent graphs, keyed by the settings they were built from
+_agent_graphs: Dict[str, Any] = {}
+
+
+def _get_agent_graph(settings: AviationAgentSettings) -> Any:
+    """
+    Get the compiled agent graph for these settings, building it on first use.
+
+    The graph holds no per-request state (conversation memory lives in the shared
+    checkpointer, keyed by thread_id), so one instance serves every stream.
+    """
+    key = settings.model_dump_json()
+    graph = _agent_graphs.get(key)
+    if graph is None:
+        graph = _agent_graphs[key] = build_agent(settings=settings)
+    return graph
+
+
+# SSE frame prefixes for the events emitted by stream_aviation_agent
+_SSE_HEADERS = {
+    name: f"event: {name}\ndata: ".encode()
+    for name in (
+        "plan", "thinking", "tool_call_start", "tool_call_end", "message",
+        "thinking_done", "ui_payload", "final_answer", "done", "error",
+    )
+}
+_SSE_TERMINATOR = b"\n\n"
+
+
+def _format_sse_event(event_name: str, event_data: Any) -> Union[bytes, str]:
+    """Format one SSE frame, encoding the data with orjson when available."""
+    if HAS_ORJSON:
+        header = _SSE_HEADERS.get(event_name) or f"event: {event_name}\ndata: ".encode()
+        # OPT_NON_STR_KEYS keeps json.dumps' handling of int/float dict keys
+        payload = orjson.dumps(event_data, option=orjson.OPT_NON_STR_KEYS)
+        return header + payload + _SSE_TERMINATOR
+    return f"event: {event_name}\ndata: {json.dumps(event_data, ensure_ascii=False)}\n\n"
+
+
+# Conversation/feedback logs are read-modify-write JSON files: one worker thread
+# keeps those writes off the event loop and serialized
+_log_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="conversation-log")
+
+
+def _log_streamed_conversation(**kwargs: Any) -> None:
+    """Log a streamed conversation; runs in a worker thread, so errors are logged here."""
+    try:
+        log_conversation_from_state(**kwargs)
+        logger.info("Conversation logged successfully")
+    except Exception as e:
+        logger.error(f"Error in conversation logging: {e}", exc_info=True)
+
+
+def _log_feedback_locally(
+    run_id: str, score: int, comment: Optional[str], log_dir: Path
+) -> None:
+    """Attach feedback to its logged conversation (runs on the log worker thread)."""
+    conversation_entry = find_conversation_by_run_id(run_id, log_dir)
+    log_feedback(
+        run_id=run_id,
+        score=score,
+        comment=comment,
+        conversation_entry=conversation_entry,
+        log_dir=log_dir,
+    )
+
+
 def _generate_thread_id() -> str:
     """Generate a unique thread ID for a new conversation."""
-    return f"thread_{uuid.uuid4().hex[:12]}"
+    return f"thread_{secrets.token_hex(6)}"
 
 
 class QuickAction(BaseModel):
@@ -64,6 +144,41 @@ class QuickActionsResponse(BaseModel):
     actions: List[QuickAction]
 
 
+# Quick actions are constant; built once instead of per request
+_QUICK_ACTIONS = QuickActionsResponse(actions=[
+    QuickAction(
+        icon="✈️",
+        title="Airports near route",
+        prompt="Find airports between EGTF and LFMD"
+    ),
+    QuickAction(
+        icon="plane",
+        title="Border crossing airports",
+        prompt="Show me border crossing airports in France"
+    ),
+    QuickAction(
+        icon="map-marker-alt",
+        title="Airports near location",
+        prompt="Find airports near Paris"
+    ),
+    QuickAction(
+        icon="fuel-pump",
+        title="Airports with AVGAS",
+        prompt="Find airports with AVGAS in Germany"
+    ),
+    QuickAction(
+        icon="route",
+        title="IFR procedures",
+        prompt="Show airports with IFR near EGTF"
+    ),
+    QuickAction(
+        icon="book",
+        title="Country rules",
+        prompt="What are the rules for flying IFR to an uncontrolled airport in France?"
+    ),
+])
+
+
 class FeedbackRequest(BaseModel):
     """User feedback for a conversation."""
     run_id: str
@@ -139,7 +254,7 @@ async def aviation_agent_chat_stream(
         raise HTTPException(status_code=404, detail="Aviation agent is disabled.")
 
     try:
-        graph = build_agent(settings=settings)
+        graph = _get_agent_graph(settings)
         messages = request.to_langchain()
         start_time = time.time()
 
@@ -175,24 +290,29 @@ async def aviation_agent_chat_stream(
                     if event_name == "done":
                         run_id = event_data.get("run_id")
 
-                    yield f"event: {event_name}\ndata: {json.dumps(event_data, ensure_ascii=False)}\n\n"
+                    yield _format_sse_event(event_name, event_data)
             finally:
-                # After streaming completes, log conversation using captured state
+                # After streaming completes, log conversation using captured state.
+                # The write runs in a worker thread so the response can finish
+                # without waiting on disk I/O.
                 try:
                     end_time = time.time()
 
                     if final_state:
                         logger.info(f"Logging conversation for session {session_id}...")
-                        log_conversation_from_state(
-                            session_id=session_id,
-                            state=final_state,
-                            messages=messages,
-                            start_time=start_time,
-                            end_time=end_time,
-                            log_dir=log_dir,
-                            run_id=run_id,
+                        asyncio.get_running_loop().run_in_executor(
+                            _log_executor,
+                            partial(
+                                _log_streamed_conversation,
+                                session_id=session_id,
+                                state=final_state,
+                                messages=messages,
+                                start_time=start_time,
+                                end_time=end_time,
+                                log_dir=log_dir,
+                                run_id=run_id,
+                            ),
                         )
-                        logger.info("Conversation logged successfully")
                     else:
                         logger.warning("Final state not captured during streaming, skipping conversation logging")
                 except Exception as e:
@@ -225,44 +345,11 @@ def get_quick_actions(
     if not settings.enabled:
         raise HTTPException(status_code=404, detail="Aviation agent is disabled.")
     
-    actions = [
-        QuickAction(
-            icon="✈️",
-            title="Airports near route",
-            prompt="Find airports between EGTF and LFMD"
-        ),
-        QuickAction(
-            icon="plane",
-            title="Border crossing airports",
-            prompt="Show me border crossing airports in France"
-        ),
-        QuickAction(
-            icon="map-marker-alt",
-            title="Airports near location",
-            prompt="Find airports near Paris"
-        ),
-        QuickAction(
-            icon="fuel-pump",
-            title="Airports with AVGAS",
-            prompt="Find airports with AVGAS in Germany"
-        ),
-        QuickAction(
-            icon="route",
-            title="IFR procedures",
-            prompt="Show airports with IFR near EGTF"
-        ),
-        QuickAction(
-            icon="book",
-            title="Country rules",
-            prompt="What are the rules for flying IFR to an uncontrolled airport in France?"
-        ),
-    ]
-
-    return QuickActionsResponse(actions=actions)
+    return _QUICK_ACTIONS
 
 
 @router.post("/feedback", response_model=FeedbackResponse)
-async def submit_feedback(
+def submit_feedback(
     request: FeedbackRequest,
     settings: AviationAgentSettings = Depends(get_settings),
 ) -> FeedbackResponse:
@@ -272,6 +359,9 @@ async def submit_feedback(
     This feedback is sent to LangSmith for quality monitoring and analysis,
     and also saved locally to conversation logs.
 
+    Declared sync so FastAPI runs it in its threadpool: the LangSmith call and
+    log file scan are blocking and would otherwise stall in-flight SSE streams.
+
     Args:
         request: FeedbackRequest with run_id, score (1=good, 0=bad), and optional comment
 
@@ -303,14 +393,9 @@ async def submit_feedback(
     # Also save feedback locally to conversation logs
     try:
         log_dir = Path(os.getenv("CONVERSATION_LOG_DIR", "logs/conversations"))
-        conversation_entry = find_conversation_by_run_id(request.run_id, log_dir)
-        log_feedback(
-            run_id=request.run_id,
-            score=request.score,
-            comment=request.comment,
-            conversation_entry=conversation_entry,
-            log_dir=log_dir,
-        )
+        _log_executor.submit(
+            _log_feedback_locally, request.run_id, request.score, request.comment, log_dir
+        ).result()
     except Exception as e:
         logger.error(f"Failed to save feedback locally: {e}", exc_info=True)
         # Don't fail the request if local logging fails
@@ -19,7 +19,7 @@ load_component_env(component_dir)
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
@@ -43,6 +43,13 @@ from api import airports, procedures, filters, statistics, rules, aviation_agent
 
 from shared.tool_context import ToolContext
 
+# Serialize JSON responses with orjson when it is installed
+try:
+    import orjson  # noqa: F401
+    DEFAULT_RESPONSE_CLASS = ORJSONResponse
+except ImportError:
+    DEFAULT_RESPONSE_CLASS = JSONResponse
+
 # Configure logging with file output (and optionally stderr for debugger)
 # Use /app/logs in Docker, /tmp/flyfun-logs for local development
 log_dir = Path(os.getenv("LOG_DIR", "/tmp/flyfun-logs"))
@@ -194,168 +201,184 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down Euro AIP Airport Explorer...")
     # ToolContext and its services will be cleaned up automatically
 
-# Create FastAPI app with lifespan context manager
-app = FastAPI(
-    title="Euro AIP Airport Explorer",
-    description="Interactive web application for exploring European airport data",
-    version="1.0.0",
-    lifespan=lifespan
-)
+def create_app(*, enable_trusted_host: bool = True) -> FastAPI:
+    """
+    Build the FastAPI application.
+
+    Args:
+        enable_trusted_host: Install TrustedHostMiddleware. Tests disable it so
+            requests need no allowed Host header.
+    """
+    # Create FastAPI app with lifespan context manager
+    app = FastAPI(
+        title="Euro AIP Airport Explorer",
+        description="Interactive web application for exploring European airport data",
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=DEFAULT_RESPONSE_CLASS,
+    )
 
-# Add security headers middleware
-@app.middleware("http")
-async def add_security_headers(request: Request, call_next):
-    response = await call_next(request)
-    
-    # Add security headers
-    for header, value in SECURITY_HEADERS.items():
-        response.headers[header] = value
-    
-    return response
-
-# Add request logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    
-    client_ip = request.client.host if request.client else "unknown"
-    logger.info(
-        f"{request.method} {request.url.path} - "
-        f"{response.status_code} - {process_time:.3f}s - {client_ip}"
+    # Add security headers middleware
+    @app.middleware("http")
+    async def add_security_headers(request: Request, call_next):
+        response = await call_next(request)
+
+        # Add security headers
+        for header, value in SECURITY_HEADERS.items():
+            response.headers[header] = value
+
+        return response
+
+    # Add request logging middleware
+    @app.middleware("http")
+    async def log_requests(request: Request, call_next):
+        start_time = time.time()
+        response = await call_next(request)
+        process_time = time.time() - start_time
+
+        client_ip = request.client.host if request.client else "unknown"
+        logger.info(
+            f"{request.method} {request.url.path} - "
+            f"{response.status_code} - {process_time:.3f}s - {client_ip}"
+        )
+        return response
+
+    # Add rate limiting middleware
+    @app.middleware("http")
+    async def rate_limit_middleware(request: Request, call_next):
+        client_ip = request.client.host if request.client else "unknown"
+
+        if not check_rate_limit(client_ip):
+            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
+            return JSONResponse(
+                status_code=429,
+                content={"detail": "Too many requests. Please try again later."}
+            )
+
+        response = await call_next(request)
+        return response
+
+    # Add security middleware
+    if enable_trusted_host:
+        app.add_middleware(
+            TrustedHostMiddleware, 
+            allowed_hosts=ALLOWED_HOSTS
+        )
+
+    # Force HTTPS in production
+    # Note: In Docker deployments, HTTPS termination happens at reverse proxy level
+    # Container should accept HTTP, so FORCE_HTTPS is typically False in Docker
+    if FORCE_HTTPS:
+        app.add_middleware(HTTPSRedirectMiddleware)
+
+    # Add CORS middleware with restricted origins
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=ALLOWED_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["GET", "POST"],
+        allow_headers=["*"],
     )
-    return response
 
-# Add rate limiting middleware
-@app.middleware("http")
-async def rate_limit_middleware(request: Request, call_next):
-    client_ip = request.client.host if request.client else "unknown"
-    
-    if not check_rate_limit(client_ip):
-        logger.warning(f"Rate limit exceeded for IP: {client_ip}")
+    # Add exception handler for validation errors to log details
+    @app.exception_handler(RequestValidationError)
+    async def validation_exception_handler(request: Request, exc: RequestValidationError):
+        """Log validation errors for debugging."""
+        logger.warning(f"Validation error on {request.url.path}: {exc.errors()}")
+        # Log the body if available
+        if hasattr(exc, 'body') and exc.body:
+            try:
+                body_str = exc.body.decode('utf-8') if isinstance(exc.body, bytes) else str(exc.body)
+                logger.debug(f"Request body: {body_str}")
+            except Exception:
+                pass
+        # Return the default FastAPI validation error response
         return JSONResponse(
-            status_code=429,
-            content={"detail": "Too many requests. Please try again later."}
+            status_code=422,
+            content={"detail": exc.errors(), "body": str(exc.body) if hasattr(exc, 'body') and exc.body else None}
         )
-    
-    response = await call_next(request)
-    return response
 
-# Add security middleware
-app.add_middleware(
-    TrustedHostMiddleware, 
-    allowed_hosts=ALLOWED_HOSTS
-)
+    # Include API routes
+    app.include_router(airports.router, prefix="/api/airports", tags=["airports"])
+    app.include_router(procedures.router, prefix="/api/procedures", tags=["procedures"])
+    app.include_router(filters.router, prefix="/api/filters", tags=["filters"])
+    app.include_router(statistics.router, prefix="/api/statistics", tags=["statistics"])
+    app.include_router(rules.router, prefix="/api/rules", tags=["rules"])
+    app.include_router(notifications.router)  # Has its own prefix /api/notifications
+
+    if aviation_agent_chat.feature_enabled():
+        logger.info("Aviation agent router enabled at /api/aviation-agent")
+        app.include_router(
+            aviation_agent_chat.router,
+            prefix="/api/aviation-agent",
+            tags=["aviation-agent"],
+        )
+    else:
+        logger.info("Aviation agent router disabled (AVIATION_AGENT_ENABLED is false)")
 
-# Force HTTPS in production
-# Note: In Docker deployments, HTTPS termination happens at reverse proxy level
-# Container should accept HTTP, so FORCE_HTTPS is typically False in Docker
-if FORCE_HTTPS:
-    app.add_middleware(HTTPSRedirectMiddleware)
-
-# Add CORS middleware with restricted origins
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=ALLOWED_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["GET", "POST"],
-    allow_headers=["*"],
-)
+    # GA Friendliness API - always mount, graceful degradation if no DB
+    app.include_router(ga_friendliness.router, prefix="/api/ga", tags=["ga-friendliness"])
 
-# Add exception handler for validation errors to log details
-@app.exception_handler(RequestValidationError)
-async def validation_exception_handler(request: Request, exc: RequestValidationError):
-    """Log validation errors for debugging."""
-    logger.warning(f"Validation error on {request.url.path}: {exc.errors()}")
-    # Log the body if available
-    if hasattr(exc, 'body') and exc.body:
-        try:
-            body_str = exc.body.decode('utf-8') if isinstance(exc.body, bytes) else str(exc.body)
-            logger.debug(f"Request body: {body_str}")
-        except Exception:
-            pass
-    # Return the default FastAPI validation error response
-    return JSONResponse(
-        status_code=422,
-        content={"detail": exc.errors(), "body": str(exc.body) if hasattr(exc, 'body') and exc.body else None}
-    )
+    # Serve static files for client assets
+    client_dir = Path(__file__).parent.parent / "client"
 
-# Include API routes
-app.include_router(airports.router, prefix="/api/airports", tags=["airports"])
-app.include_router(procedures.router, prefix="/api/procedures", tags=["procedures"])
-app.include_router(filters.router, prefix="/api/filters", tags=["filters"])
-app.include_router(statistics.router, prefix="/api/statistics", tags=["statistics"])
-app.include_router(rules.router, prefix="/api/rules", tags=["rules"])
-app.include_router(notifications.router)  # Has its own prefix /api/notifications
-
-if aviation_agent_chat.feature_enabled():
-    logger.info("Aviation agent router enabled at /api/aviation-agent")
-    app.include_router(
-        aviation_agent_chat.router,
-        prefix="/api/aviation-agent",
-        tags=["aviation-agent"],
-    )
-else:
-    logger.info("Aviation agent router disabled (AVIATION_AGENT_ENABLED is false)")
+    # Debug logging to verify paths
+    logger.info(f"Client directory: {client_dir}")
 
-# GA Friendliness API - always mount, graceful degradation if no DB
-app.include_router(ga_friendliness.router, prefix="/api/ga", tags=["ga-friendliness"])
+    # Add cache control middleware for development
+    @app.middleware("http")
+    async def add_cache_control_headers(request: Request, call_next):
+        response = await call_next(request)
 
-# Serve static files for client assets
-client_dir = Path(__file__).parent.parent / "client"
+        # Add cache control headers for JavaScript/TypeScript files in development
+        if request.url.path.endswith(('.js', '.ts')):
+            response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
+            response.headers["Pragma"] = "no-cache"
+            response.headers["Expires"] = "0"
 
-# Debug logging to verify paths
-logger.info(f"Client directory: {client_dir}")
+        return response
+
+    # Mount static files
+    css_dir = os.path.join(client_dir, "css")
+    app.mount("/css", StaticFiles(directory=css_dir, html=True), name="css")
+
+    # Mount assets (logos, images)
+    assets_dir = client_dir / "assets"
+    if assets_dir.exists():
+        app.mount("/assets", StaticFiles(directory=str(assets_dir)), name="assets")
+        logger.info(f"Assets directory mounted: {assets_dir}")
+
+    # Mount TypeScript build output (for production)
+    ts_dist_dir = client_dir / "dist"
+    if ts_dist_dir.exists():
+        app.mount("/dist", StaticFiles(directory=str(ts_dist_dir), html=True), name="dist")
+        logger.info(f"TypeScript dist directory mounted: {ts_dist_dir}")
+
+    # Mount TypeScript source (for development - Vite handles this, but fallback)
+    ts_dir = client_dir / "ts"
+    if ts_dir.exists():
+        app.mount("/ts", StaticFiles(directory=str(ts_dir), html=True), name="ts")
+        logger.info(f"TypeScript source directory mounted: {ts_dir}")
+
+    @app.get("/")
+    async def read_root():
+        """Serve the main HTML page."""
+        html_file = client_dir / "index.html"
+        return FileResponse(str(html_file))
+
+    @app.get("/health")
+    async def health_check():
+        """Health check endpoint."""
+        return {
+            "status": "healthy",
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
+    return app
+
+
+app = create_app()
 
-# Add cache control middleware for development
-@app.middleware("http")
-async def add_cache_control_headers(request: Request, call_next):
-    response = await call_next(request)
-    
-    # Add cache control headers for JavaScript/TypeScript files in development
-    if request.url.path.endswith(('.js', '.ts')):
-        response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-        response.headers["Pragma"] = "no-cache"
-        response.headers["Expires"] = "0"
-    
-    return response
-
-# Mount static files
-css_dir = os.path.join(client_dir, "css")
-app.mount("/css", StaticFiles(directory=css_dir, html=True), name="css")
-
-# Mount assets (logos, images)
-assets_dir = client_dir / "assets"
-if assets_dir.exists():
-    app.mount("/assets", StaticFiles(directory=str(assets_dir)), name="assets")
-    logger.info(f"Assets directory mounted: {assets_dir}")
-
-# Mount TypeScript build output (for production)
-ts_dist_dir = client_dir / "dist"
-if ts_dist_dir.exists():
-    app.mount("/dist", StaticFiles(directory=str(ts_dist_dir), html=True), name="dist")
-    logger.info(f"TypeScript dist directory mounted: {ts_dist_dir}")
-
-# Mount TypeScript source (for development - Vite handles this, but fallback)
-ts_dir = client_dir / "ts"
-if ts_dir.exists():
-    app.mount("/ts", StaticFiles(directory=str(ts_dir), html=True), name="ts")
-    logger.info(f"TypeScript source directory mounted: {ts_dir}")
-
-@app.get("/")
-async def read_root():
-    """Serve the main HTML page."""
-    html_file = client_dir / "index.html"
-    return FileResponse(str(html_file))
-
-@app.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat()
-    }
 
 if __name__ == "__main__":
     # show environment variables